@@ -14,17 +14,113 @@
     You may obtain a copy of the License at:    
     https://opensource.org/licenses/BSD-3-Clause
 """
-import gzip
+import os
 import json
+import time
+import calendar
+import tempfile
+import threading
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
-from ftplib import FTP
+from ftplib import FTP, error_perm, all_errors
 from io import BytesIO
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from matplotlib import pyplot as plt
 
+# Feather (Arrow IPC) files can be memory-mapped, used for the analytics cache
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+class dwx_ftp_pool():
+    
+    def __init__(self, ftp_credentials):
+        
+        """Pool of logged-in FTP sessions, shared by download worker threads.
+        
+        Sessions are opened lazily, so the number of open connections never
+        exceeds the number of threads using the pool at the same time.
+        
+        Parameters
+        ----------
+        ftp_credentials : dict
+            server, username and password (and optionally port) keys.
+        --
+        """
+        
+        self.ftp_credentials = ftp_credentials
+        self.idle = []
+        self.lock = threading.Lock()
+    
+    def connect(self):
+        
+        ftp = FTP()
+        ftp.connect(self.ftp_credentials['server'],
+                    int(self.ftp_credentials.get('port', 21)))
+        ftp.login(self.ftp_credentials['username'],
+                  self.ftp_credentials['password'])
+        
+        return ftp
+    
+    @contextmanager
+    def connection(self):
+        
+        """Borrow a session, returning it to the pool when done."""
+        
+        with self.lock:
+            ftp = self.idle.pop() if self.idle else None
+        
+        # The server may have timed out an idle session (421), reconnect
+        if ftp is not None and not self.is_alive(ftp):
+            ftp = None
+        
+        if ftp is None:
+            ftp = self.connect()
+        
+        try:
+            yield ftp
+        
+        except Exception:
+            # Session state is unknown after a failure, don't reuse it
+            ftp.close()
+            raise
+        
+        with self.lock:
+            self.idle.append(ftp)
+    
+    def is_alive(self, ftp):
+        
+        try:
+            ftp.voidcmd('NOOP')
+            return True
+        
+        except all_errors:
+            ftp.close()
+            return False
+    
+    def close(self):
+        
+        """QUIT all idle sessions."""
+        
+        with self.lock:
+            idle, self.idle = self.idle, []
+        
+        for ftp in idle:
+            try:
+                ftp.quit()
+            except Exception:
+                ftp.close()
+
 class dwx_data_analytics():
     
-    def __init__(self, config='<ENTER-FTP-CREDENTIALS-CFG-FILE-PATH-HERE>'):
+    def __init__(self, config='<ENTER-FTP-CREDENTIALS-CFG-FILE-PATH-HERE>',
+                 connections=4,
+                 mirror_dir=None,
+                 cache_dir=None):
         
         """Initialize variables, setup byte buffer and FTP connection.
         
@@ -41,6 +137,17 @@ class dwx_data_analytics():
             
         ftp_port : int
             Port to connect to FTP server on.
+        
+        connections : int
+            Default number of parallel FTP connections used for downloads.
+        
+        mirror_dir : str
+            Local mirror of the FTP tree, kept up to date by sync(). Files
+            found there are read locally instead of being downloaded.
+        
+        cache_dir : str
+            Directory for typed Feather copies of get_analytics() results.
+            Requires pyarrow.
         --
         """
         
@@ -51,6 +158,13 @@ class dwx_data_analytics():
                       'MONTHLY_DIVERGENCE': ['timestamp','average_divergence','monthly_divergence'],
                       'DAILY_FIXED_DIVERGENCE': ['timestamp','profit_difference'],
                       'DAILY_REAL_DIVERGENCE': ['timestamp','profit_difference']}
+        
+        # Newlines become separators when parsing list data in one pass
+        self.list_translation = bytes.maketrans(b'\n', b',')
+        
+        # Columns that are not numeric, all others are typed as float64
+        self.analytics_non_numeric = {'AVG_LEVERAGE': ['darwin_vs_eurusd_volatility'],
+                                      'ORDER_DIVERGENCE': ['instrument']}
     
         # Setup data container
         self.retbuf = BytesIO()
@@ -64,19 +178,35 @@ class dwx_data_analytics():
                         for l in open(_filename))}
 
         # FTP credentials
+        self.config = config
         self.ftp_credentials = load_config(config)
         
+        # Extra FTP sessions for parallel downloads
+        self.connections = connections
+        self.ftp_pool = dwx_ftp_pool(self.ftp_credentials)
+        
+        # Local copy of the FTP tree, see sync()
+        self.mirror_dir = mirror_dir
+        
+        # Typed columnar copies of analytics, see get_analytics()
+        self.cache_dir = cache_dir
+        
+        if cache_dir is not None and feather is None:
+            print('[WARNING] pyarrow is not installed, analytics will not be cached.')
+        
         try:
-            self.server = FTP(self.ftp_credentials['server'])
-            self.server.login(self.ftp_credentials['username'],
-                              self.ftp_credentials['password'])
+            server = self.ftp_pool.connect()
             
             # 200+ codes signify success.
-            if str(self.server.lastresp).startswith('2'):
+            if str(server.lastresp).startswith('2'):
                 print('[KERNEL] FTP Connection Successful. Data will now be pulled from Darwinex FTP Server.')
                 self.mode = 1 # 1 = FTP, 0
             
-            print(f'[KERNEL] Last FTP Status Code: {self.server.lastresp} | Please consult https://en.wikipedia.org/wiki/List_of_FTP_server_return_codes for code definitions.')
+            print(f'[KERNEL] Last FTP Status Code: {server.lastresp} | Please consult https://en.wikipedia.org/wiki/List_of_FTP_server_return_codes for code definitions.')
+            
+            # Every FTP call goes through the pool, so re-use this session there
+            with self.ftp_pool.lock:
+                self.ftp_pool.idle.append(server)
                 
         except Exception as ex:
             print(ex)
@@ -124,14 +254,22 @@ class dwx_data_analytics():
         # Clear / reinitialize buffer
         self.retbuf = BytesIO()
         
-        self.server.retrbinary(f"RETR {darwin}/{data_type}", self.retbuf.write)
+        with self.ftp_pool.connection() as ftp:
+            ftp.retrbinary(f"RETR {darwin}/{data_type}", self.retbuf.write)
+        
         self.retbuf.seek(0)
         
+        return self.parse_data(self.retbuf)
+    
+    def parse_data(self, buf):
+        
+        """Parse an analytics file (see parse_line) into a DataFrame."""
+        
         # Extract data from BytesIO object
         ret = []
         
         while True:
-            line = self.retbuf.readline()
+            line = buf.readline()
             if len(line) > 1:
                 ret.append(self.parse_line(line.strip().decode()))
             else:
@@ -161,6 +299,13 @@ class dwx_data_analytics():
             Pandas DataFrame
         --
         """
+        mirror_file = self.get_mirror_path(f'{str(darwin).upper()}/{str(data_type).upper()}')
+        
+        # Mirrored copy first, see sync()
+        if mirror_file is not None and os.path.exists(mirror_file):
+            with open(mirror_file, 'rb') as f:
+                return self.parse_data(f)
+        
         if self.mode == 0:
             return pd.read_csv(f'{str(darwin).upper()}/{str(data_type).upper()}', header=None)
         else:
@@ -168,7 +313,7 @@ class dwx_data_analytics():
     
     ##########################################################################
     
-    def get_analytics(self, darwin, data_type):
+    def get_analytics(self, darwin, data_type, refresh=False):
         
         """Get, index and prepare requested data.
         
@@ -178,6 +323,12 @@ class dwx_data_analytics():
             - converting millisecond timestamps column to Pandas datetime
             - Setting the above converted timestamps as the index
             - Dropping the timestamp column itself.            
+            - Converting all other columns to float64, except those in
+              self.analytics_non_numeric
+        
+        With cache_dir set, the result is stored as a Feather file and later
+        calls memory-map it instead of parsing the raw data again. A cached
+        file is rebuilt when its source is newer, see is_cache_fresh().
         
         Parameters
         ----------
@@ -187,6 +338,9 @@ class dwx_data_analytics():
         data_type : str
             Must be a key in self.analytics_headers dictionary.
             
+        refresh : bool
+            If True, ignore any cached copy and parse the raw data again.
+        
         Returns
         -------
         df
@@ -194,16 +348,282 @@ class dwx_data_analytics():
         --
         """
         
+        cache_file = self.get_cache_path(darwin, data_type)
+        
+        if cache_file is not None and not refresh and self.is_cache_fresh(darwin, data_type):
+            return self.read_cache(cache_file)
+        
         df = self.get_data_from_file(darwin, data_type)
         
         df.columns = self.analytics_headers[data_type]
-        df.set_index(pd.to_datetime(df['timestamp'], unit='ms'), inplace=True)
+        
+        non_numeric = self.analytics_non_numeric.get(data_type, [])
+        for column in df.columns:
+            if column != 'timestamp' and column not in non_numeric:
+                df[column] = pd.to_numeric(df[column], errors='coerce').astype(np.float64)
+        
+        df.set_index(pd.to_datetime(pd.to_numeric(df['timestamp']), unit='ms'), inplace=True)
         df.drop(['timestamp'], axis=1, inplace=True)
         
+        if cache_file is not None:
+            self.write_cache(cache_file, df)
+        
         return df
     
     ##########################################################################
+    
+    def get_cache_path(self, darwin, data_type):
+        
+        """Feather cache path for (darwin, data_type), None if not caching."""
+        
+        if self.cache_dir is None or feather is None:
+            return None
+        
+        return os.path.join(self.cache_dir, str(darwin).upper(), f'{str(data_type).upper()}.feather')
+    
+    def is_cache_fresh(self, darwin, data_type):
+        
+        """True if the cached frame is at least as new as its source: the
+        mirrored file, the local file (file mode) or the server's copy."""
+        
+        cache_file = self.get_cache_path(darwin, data_type)
+        
+        if not os.path.exists(cache_file):
+            return False
+        
+        ftp_path = f'{str(darwin).upper()}/{str(data_type).upper()}'
+        mirror_file = self.get_mirror_path(ftp_path)
+        
+        if mirror_file is not None and os.path.exists(mirror_file):
+            source_mtime = os.path.getmtime(mirror_file)
+        
+        elif self.mode == 0:
+            source_mtime = os.path.getmtime(ftp_path) if os.path.exists(ftp_path) else None
+        
+        else:
+            # One MDTM round trip instead of downloading the file again
+            try:
+                with self.ftp_pool.connection() as ftp:
+                    source_mtime = self.get_ftp_mtime(ftp, ftp_path)
+            except all_errors:
+                source_mtime = None
+        
+        # Source time unknown (no MDTM support, server unreachable), keep it
+        if source_mtime is None:
+            return True
+        
+        return os.path.getmtime(cache_file) >= source_mtime
+    
+    def read_cache(self, cache_file):
+        
+        # Memory-mapped, numeric columns are read without copying the file
+        table = feather.read_table(cache_file, memory_map=True)
+        
+        # to_pandas() would turn Arrow lists into ndarrays, return them as
+        # lists like parse_line() does
+        list_columns = [field.name for field in table.schema if pa.types.is_list(field.type)]
+        
+        df = table.drop_columns(list_columns).to_pandas()
+        
+        for name in list_columns:
+            df[name] = table.column(name).to_pylist()
+        
+        # Keep the original column order
+        df = df[table.column_names]
+        
+        return df.set_index('timestamp')
+    
+    def write_cache(self, cache_file, df, list_columns=None):
+        
+        """Write df to cache_file, plus any {name: Arrow list array} columns
+        (see get_list_analytics())."""
         
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            
+            table = pa.Table.from_pandas(df.reset_index(), preserve_index=False)
+            
+            for name, column in (list_columns or {}).items():
+                table = table.append_column(name, column)
+            
+            # Uncompressed, so the file can be memory-mapped as is
+            feather.write_feather(table, cache_file + '.tmp', compression='uncompressed')
+            os.replace(cache_file + '.tmp', cache_file)
+        
+        except (pa.ArrowException, OSError) as ex:
+            print(ex)
+    
+    ##########################################################################
+        
+    def get_raw_data(self, darwin, data_type):
+        
+        """Raw bytes of {darwin}/{data_type}, from the mirror if present,
+        otherwise from the local file (file mode) or a pooled FTP connection."""
+        
+        ftp_path = f'{str(darwin).upper()}/{str(data_type).upper()}'
+        mirror_file = self.get_mirror_path(ftp_path)
+        
+        if mirror_file is not None and os.path.exists(mirror_file):
+            with open(mirror_file, 'rb') as f:
+                return f.read()
+        
+        if self.mode == 0:
+            with open(ftp_path, 'rb') as f:
+                return f.read()
+        
+        buf = BytesIO()
+        
+        with self.ftp_pool.connection() as ftp:
+            ftp.retrbinary(f"RETR {ftp_path}", buf.write)
+        
+        return buf.getvalue()
+    
+    def parse_list_data(self, data, n_scalars):
+        
+        """Vectorized parser for lines of numeric fields ending in a list or
+        a list of lists, e.g. AVG_LEVERAGE:
+            
+            1546300800000,3,[0.55,0.93,0.71]
+            1546300800000,3,[[0.55,0.93],[0.93,0.55]]
+        
+        Replaces parse_line() for such files: all numbers are parsed in one
+        C pass, with no eval/json and no Python object per row. Lists are
+        returned in ragged form, where innermost list i holds
+            
+            values[list_offsets[i]:list_offsets[i + 1]]
+        
+        and row j holds innermost lists row_offsets[j] to row_offsets[j + 1].
+        
+        Parameters
+        ----------
+        data : bytes
+            Raw file contents.
+        
+        n_scalars : int
+            Number of numeric fields before the list on each line.
+        
+        Returns
+        -------
+        scalars, values, list_offsets, row_offsets
+            (rows x n_scalars) and ragged float64 / int64 arrays.
+        --
+        """
+        
+        data = data.strip()
+        raw = np.frombuffer(data + b'\n', dtype=np.uint8)
+        
+        newlines = np.flatnonzero(raw == ord('\n'))
+        commas = np.cumsum(raw == ord(','))
+        
+        # Each comma separates two numbers once brackets are removed
+        row_sizes = np.diff(np.r_[0, commas[newlines]]) + 1
+        
+        numbers = np.fromstring(data.translate(self.list_translation, b"[]'\" \r"),
+                                dtype=np.float64, sep=',')
+        
+        if len(numbers) != row_sizes.sum():
+            raise ValueError('Unexpected list data format, expected numbers only')
+        
+        # Split each row's numbers into leading scalars and list values
+        row_starts = np.r_[0, np.cumsum(row_sizes)[:-1]]
+        scalar_index = row_starts[:, None] + np.arange(n_scalars)
+        
+        scalars = numbers[scalar_index]
+        
+        is_value = np.ones(len(numbers), dtype=bool)
+        is_value[scalar_index.ravel()] = False
+        values = numbers[is_value]
+        
+        # Innermost lists open with '[' not followed by '[' and close with
+        # ']' not preceded by ']'
+        opens = np.flatnonzero(raw == ord('['))
+        closes = np.flatnonzero(raw == ord(']'))
+        
+        list_starts = opens[raw[opens + 1] != ord('[')]
+        list_ends = closes[raw[closes - 1] != ord(']')]
+        
+        list_offsets = np.r_[0, np.cumsum(commas[list_ends] - commas[list_starts] + 1)]
+        row_offsets = np.r_[0, np.cumsum(np.bincount(np.searchsorted(newlines, list_starts),
+                                                     minlength=len(newlines)))]
+        
+        return scalars, values, list_offsets, row_offsets
+    
+    def get_list_analytics(self, darwin, data_type='AVG_LEVERAGE', refresh=False):
+        
+        """Get list-valued analytics through parse_list_data().
+        
+        Uses the same Feather cache file as get_analytics(), with the list
+        column stored as an Arrow list built from (and read back into) the
+        ragged arrays without copying.
+        
+        Parameters
+        ----------
+        darwin : str
+            DARWIN ticker symbol, e.g. $PLF
+        
+        data_type : str
+            Key in self.analytics_headers whose last column is a list.
+        
+        refresh : bool
+            If True, ignore any cached copy and parse the raw data again.
+        
+        Returns
+        -------
+        df, values, list_offsets, row_offsets
+            df holds the scalar columns, indexed by timestamp. The list
+            column is returned in ragged form, see parse_list_data().
+        --
+        """
+        
+        headers = self.analytics_headers[data_type]
+        cache_file = self.get_cache_path(darwin, data_type)
+        
+        if cache_file is not None and not refresh and self.is_cache_fresh(darwin, data_type):
+            return self.read_list_cache(cache_file, headers[-1])
+        
+        data = self.get_raw_data(darwin, data_type)
+        
+        scalars, values, list_offsets, row_offsets = self.parse_list_data(data, len(headers) - 1)
+        
+        df = pd.DataFrame(scalars[:, 1:], columns=headers[1:-1],
+                          index=pd.to_datetime(scalars[:, 0].astype(np.int64), unit='ms'))
+        df.index.name = 'timestamp'
+        
+        if cache_file is not None:
+            
+            # Same Arrow type get_analytics() infers from parse_line() lists
+            column = pa.ListArray.from_arrays(pa.array(list_offsets.astype(np.int32)), pa.array(values))
+            
+            if b'[[' in data:
+                column = pa.ListArray.from_arrays(pa.array(row_offsets.astype(np.int32)), column)
+            
+            self.write_cache(cache_file, df, {headers[-1]: column})
+        
+        return df, values, list_offsets, row_offsets
+    
+    def read_list_cache(self, cache_file, list_column):
+        
+        """Read a cached frame, returning its list column in ragged form."""
+        
+        table = feather.read_table(cache_file, memory_map=True)
+        
+        df = table.drop_columns([list_column]).to_pandas().set_index('timestamp')
+        column = table.column(list_column).combine_chunks()
+        
+        # List of lists: one more level of offsets
+        if pa.types.is_list(column.type.value_type):
+            row_offsets = column.offsets.to_numpy().astype(np.int64)
+            column = column.values
+        else:
+            row_offsets = np.arange(len(column) + 1)
+        
+        list_offsets = column.offsets.to_numpy().astype(np.int64)
+        values = column.values.to_numpy().astype(np.float64, copy=False)
+        
+        return df, values, list_offsets, row_offsets
+    
+    ##########################################################################
+    
     def get_darwin_vs_eurusd_volatility(self, darwin, plot=True):
         
         """Get the evolution of the given DARWIN's volatility vs that of the EUR/USD.
@@ -226,12 +646,11 @@ class dwx_data_analytics():
         # Set required data type
         data_type = 'AVG_LEVERAGE'
         
-        # Get raw data into pandas dataframe
-        df = self.get_analytics(darwin, data_type)
+        # Get raw data, the list column in ragged form
+        df, values, list_offsets, row_offsets = self.get_list_analytics(darwin, data_type)
             
         # DARWIN vs EURUSD volatility is a list. We need the last value
-        df.loc[:,self.analytics_headers[data_type][-1]] = \
-            df.loc[:,self.analytics_headers[data_type][-1]].apply(eval).apply(lambda x: x[-1])
+        df[self.analytics_headers[data_type][-1]] = values[list_offsets[row_offsets[1:]] - 1]
             
         if plot:
             df['darwin_vs_eurusd_volatility'].plot(title=f'${darwin}: DARWIN vs EUR/USD Volatility',
@@ -430,12 +849,105 @@ class dwx_data_analytics():
     
     ##########################################################################
     
+    def list_ftp_dir(self, path):
+        
+        """List a directory on the FTP server over a pooled connection."""
+        
+        files = []
+        
+        with self.ftp_pool.connection() as ftp:
+            ftp.retrlines(f'NLST {path}', files.append)
+        
+        # Some servers return full paths, keep file names only
+        return [f.rsplit('/', 1)[-1] for f in files]
+    
+    def get_quote_file_from_ftp(self, tick_file, chunksize=None):
+        
+        """Download one .csv.gz Quote file over a pooled connection, or read
+        it from the mirror, and return its (timestamps, quotes) arrays."""
+        
+        mirror_file = self.get_mirror_path(tick_file)
+        
+        if mirror_file is not None and os.path.exists(mirror_file):
+            with open(mirror_file, 'rb') as f:
+                return self.parse_quote_file(f, chunksize=chunksize)
+        
+        # In chunked mode large downloads spill to disk instead of RAM
+        if chunksize is None:
+            buf = BytesIO()
+        else:
+            buf = tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024)
+        
+        with buf:
+            with self.ftp_pool.connection() as ftp:
+                ftp.retrbinary(f"RETR {tick_file}", buf.write)
+        
+            buf.seek(0)
+        
+            return self.parse_quote_file(buf, chunksize=chunksize)
+        
+    def iter_quote_file(self, buf, chunksize=1000000):
+        
+        """Parse a gzipped timestamp,quote CSV, yielding (timestamps, quotes)
+        arrays of up to chunksize ticks at a time."""
+        
+        reader = pd.read_csv(buf, compression='gzip', engine='c',
+                             header=0, names=['timestamp','quote'],
+                             dtype={'timestamp': np.int64, 'quote': np.float64},
+                             chunksize=chunksize)
+        
+        with reader:
+            for chunk in reader:
+                yield chunk['timestamp'].to_numpy(), chunk['quote'].to_numpy()
+    
+    def parse_quote_file(self, buf, chunksize=None):
+        
+        """Parse a gzipped timestamp,quote CSV into typed arrays.
+        
+        Decompression and parsing both run in pandas' C reader, no Python
+        objects are created per tick.
+        
+        Parameters
+        ----------
+        buf : file-like
+            Gzip compressed CSV with a header line.
+        
+        chunksize : int
+            If set, parse chunksize ticks at a time, for files that would
+            not fit in memory as text.
+        
+        Returns
+        -------
+        timestamps, quotes
+            int64 millisecond timestamps and float64 quotes.
+        --
+        """
+        
+        if chunksize is None:
+            df = pd.read_csv(buf, compression='gzip', engine='c',
+                             header=0, names=['timestamp','quote'],
+                             dtype={'timestamp': np.int64, 'quote': np.float64})
+        
+            return df['timestamp'].to_numpy(), df['quote'].to_numpy()
+        
+        chunks = list(self.iter_quote_file(buf, chunksize=chunksize))
+        
+        if len(chunks) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        
+        return (np.concatenate([chunk[0] for chunk in chunks]),
+                np.concatenate([chunk[1] for chunk in chunks]))
+    
+    ##########################################################################
+    
     def get_quotes_from_ftp(self, 
                             darwin='PLF',
                             suffix='4.1',
                             monthly=True, # If set to False, month/year used.
                             month='01',
-                            year='2019'):
+                            year='2019',
+                            connections=None, # Defaults to self.connections
+                            chunksize=None):
         
         """Download Quote data for any DARWIN directly via FTP.
                 
@@ -465,6 +977,13 @@ class dwx_data_analytics():
                 
                 Specifies year for {year}-{month} tuple as above.
             
+        connections : int
+            Number of FTP connections listing and downloading in parallel.
+        
+        chunksize : int
+            If set, files are spooled to disk and parsed chunksize ticks at
+            a time instead of entirely in memory.
+
         Returns
         -------
         df
@@ -474,25 +993,34 @@ class dwx_data_analytics():
         quote_files = []
         roots = []
         
+        connections = connections or self.connections
+        
         if monthly:
             
             tqdm.write(f'\n[KERNEL] Searching for Quote data, please wait..', end='')
-            self.server.retrlines(f'NLST {darwin}/quotes/', roots.append)
+            roots = self.list_ftp_dir(f'{darwin}/quotes/')
             
-            roots_pbar = tqdm(roots, position=0, leave=True)
-            for root in roots_pbar:
-                try:
-                    roots_pbar.set_description("Getting filenames for month: %s" % root)
-                    root_files = []
+            # List all months in parallel, keeping month order in the result
+            root_files = {}
                 
-                    self.server.retrlines(f'NLST {darwin}/quotes/{root}', root_files.append)
+            with ThreadPoolExecutor(max_workers=connections) as executor:
                 
-                    # Finalize filenames
-                    quote_files += [f'{darwin}/quotes/{root}/{root_file}'\
-                                    for root_file in root_files if '{}.{}'.format(darwin, suffix) in root_file]
-                except Exception as ex:
-                    print(ex)
-                    return
+                futures = {executor.submit(self.list_ftp_dir, f'{darwin}/quotes/{root}'): root
+                           for root in roots}
+                
+                roots_pbar = tqdm(as_completed(futures), total=len(futures), position=0, leave=True)
+                for future in roots_pbar:
+                    try:
+                        roots_pbar.set_description("Getting filenames for month: %s" % futures[future])
+                        root_files[futures[future]] = future.result()
+                    except Exception as ex:
+                        print(ex)
+                        return
+            
+            # Finalize filenames
+            for root in roots:
+                quote_files += [f'{darwin}/quotes/{root}/{root_file}'\
+                                for root_file in root_files[root] if '{}.{}'.format(darwin, suffix) in root_file]
             
         elif pd.to_numeric(month) > 0 and pd.to_numeric(year) > 2010:
             
@@ -500,7 +1028,7 @@ class dwx_data_analytics():
             quote_files = []
             
             try:
-                self.server.retrlines(f'NLST {darwin}/quotes/{year}-{month}/', quote_files.append)
+                quote_files = self.list_ftp_dir(f'{darwin}/quotes/{year}-{month}/')
                 quote_files = [f'{darwin}/quotes/{year}-{month}/{quote_file}'\
                                     for quote_file in quote_files if '{}.{}'.format(darwin, suffix) in quote_file]
             except Exception as ex:
@@ -510,37 +1038,317 @@ class dwx_data_analytics():
             print('\n[ERROR] Please either set monthly=True or ensure both month and year have integer values')
             return
             
-        # Process tick data files
+        # Process tick data files, downloading over several connections
         tqdm.write(f'\n[KERNEL] {len(quote_files)} files retrieved.. post-processing now, please wait..', end='')
-        ticks_df = pd.DataFrame()
-        ticks_pbar = tqdm(quote_files, position=0, leave=True)
+        ticks = {}
         
-        for tick_file in ticks_pbar:
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            
+            futures = {executor.submit(self.get_quote_file_from_ftp, tick_file, chunksize): tick_file
+                       for tick_file in quote_files}
+            
+            ticks_pbar = tqdm(as_completed(futures), total=len(futures), position=0, leave=True)
+            for future in ticks_pbar:
+                try:
+                    ticks_pbar.set_description("Processing %s" % futures[future])
+                    ticks[futures[future]] = future.result()
+                except Exception as ex:
+                    print(ex)
+        
+        # Assemble in file (chronological) order, copying each file's
+        # arrays once into the final ones and releasing them as we go
+        tick_files = [tick_file for tick_file in quote_files if tick_file in ticks]
+        total = sum(len(ticks[tick_file][0]) for tick_file in tick_files)
+        
+        timestamps = np.empty(total, dtype=np.int64)
+        quotes = np.empty(total, dtype=np.float64)
+        
+        i = 0
+        for tick_file in tick_files:
+            file_timestamps, file_quotes = ticks.pop(tick_file)
+            timestamps[i:i + len(file_timestamps)] = file_timestamps
+            quotes[i:i + len(file_quotes)] = file_quotes
+            i += len(file_timestamps)
+        
+        ticks_df = pd.DataFrame({'quote': quotes},
+                                index=pd.to_datetime(timestamps, unit='ms'))
+        ticks_df.index.name = 'timestamp'
+        
+        # Return DataFrame
+        return ticks_df.dropna()
+    
+    ##########################################################################
+
+    def get_mirror_path(self, ftp_path):
+        
+        """Local mirror path of an FTP path, None if no mirror is set."""
+        
+        if self.mirror_dir is None:
+            return None
+        
+        return os.path.join(self.mirror_dir, *ftp_path.split('/'))
+    
+    def get_ftp_mtime(self, ftp, ftp_path):
+        
+        """Modification time (UTC epoch seconds) of an FTP file via MDTM,
+        None if the server does not support it."""
+        
+        try:
+            # e.g. '213 20190101120000' or '213 20190101120000.123'
+            return calendar.timegm(time.strptime(ftp.sendcmd(f'MDTM {ftp_path}')[4:18],
+                                                 '%Y%m%d%H%M%S'))
+        except (error_perm, ValueError):
+            return None
+    
+    def sync_file(self, ftp_path):
+        
+        """Bring one mirrored file up to date with the FTP server.
+        
+        The file is skipped if its local size and modification time match
+        the server's SIZE and MDTM. Otherwise it is downloaded to a .part
+        file, resuming (REST) from an earlier interrupted download of the
+        same remote SIZE and MDTM, and moved into place once complete.
+        
+        Returns
+        -------
+        status
+            'skipped', 'downloaded', 'resumed' or 'missing'
+        --
+        """
+        
+        mirror_file = self.get_mirror_path(ftp_path)
+        part_file = mirror_file + '.part'
+        
+        # Remote SIZE / MDTM the .part file was downloaded from
+        part_info_file = part_file + '.json'
+        
+        with self.ftp_pool.connection() as ftp:
+            
+            # SIZE is only reliable in binary mode
+            ftp.voidcmd('TYPE I')
             
             try:
-                ticks_pbar.set_description("Processing %s" % tick_file)
+                size = ftp.size(ftp_path)
+            except error_perm:
+                return 'missing'
+            
+            mtime = self.get_ftp_mtime(ftp, ftp_path)
+            
+            if os.path.exists(mirror_file):
+                stat = os.stat(mirror_file)
+                if stat.st_size == size and (mtime is None or int(stat.st_mtime) == mtime):
+                    return 'skipped'
+            
+            os.makedirs(os.path.dirname(mirror_file), exist_ok=True)
+            
+            part_info = {'size': size, 'mtime': mtime}
+            offset = 0
+            
+            # Resume a partial download, unless the remote file changed since
+            if os.path.exists(part_file):
+                
+                try:
+                    with open(part_info_file, 'r') as f:
+                        same_file = json.load(f) == part_info
+                except (OSError, ValueError):
+                    same_file = False
                 
-                # Clear / reinitialize buffer
-                self.retbuf = BytesIO()
+                if same_file and os.path.getsize(part_file) <= size:
+                    offset = os.path.getsize(part_file)
+                else:
+                    os.remove(part_file)
+            
+            with open(part_info_file, 'w') as f:
+                json.dump(part_info, f)
+            
+            with open(part_file, 'ab' if offset > 0 else 'wb') as f:
+                ftp.retrbinary(f'RETR {ftp_path}', f.write, rest=offset if offset > 0 else None)
+        
+        os.replace(part_file, mirror_file)
+        os.remove(part_info_file)
+        
+        # Keep the server's timestamp to detect future changes
+        if mtime is not None:
+            os.utime(mirror_file, (mtime, mtime))
+        
+        return 'resumed' if offset > 0 else 'downloaded'
+    
+    def sync(self, darwins, data_types=None, quotes=True, connections=None):
+        
+        """Mirror DARWIN analytics and Quote files into self.mirror_dir.
+        
+        Only new or changed files are downloaded, so repeated calls are
+        cheap. Once mirrored, get_analytics() and get_quotes_from_ftp() read
+        the local copies.
+        
+        Parameters
+        ----------
+        darwins : list
+            DARWIN ticker symbols, e.g. ['PLF', 'SYO']
+        
+        data_types : list
+            Analytics files to mirror, defaults to all in
+            self.analytics_headers.
+        
+        quotes : bool
+            If True, also mirror {darwin}/quotes/{yyyy-mm}/*.csv.gz
+        
+        connections : int
+            Number of FTP connections used in parallel.
+        
+        Returns
+        -------
+        dict
+            Status of each FTP path, see sync_file(). Paths that could not
+            be listed or downloaded are marked 'failed'.
+        --
+        """
+        
+        if self.mirror_dir is None:
+            print('\n[ERROR] Please set mirror_dir to use sync()')
+            return
+        
+        connections = connections or self.connections
+        data_types = list(self.analytics_headers) if data_types is None else data_types
+        
+        ftp_paths = [f'{str(darwin).upper()}/{str(data_type).upper()}'
+                     for darwin in darwins for data_type in data_types]
+        
+        status = {}
+        
+        with ThreadPoolExecutor(max_workers=connections) as executor:
             
-                self.server.retrbinary(f"RETR {tick_file}", self.retbuf.write)
-                self.retbuf.seek(0)
+            if quotes:
                 
-                # Extract data from BytesIO object
-                ret = [line.strip().decode().split(',') for line in gzip.open(self.retbuf)]
-                ticks_df = pd.concat([ticks_df, pd.DataFrame(ret[1:])], axis=0)
+                tqdm.write('\n[KERNEL] Searching for Quote data, please wait..', end='')
                 
-            except Exception as ex:
-                print(ex)
+                roots = {darwin: executor.submit(self.list_ftp_dir, f'{str(darwin).upper()}/quotes')
+                         for darwin in darwins}
+                
+                # A DARWIN whose listing fails is reported, not fatal
+                months = []
+                for darwin, future in roots.items():
+                    try:
+                        months += [f'{str(darwin).upper()}/quotes/{root}' for root in future.result()]
+                    except error_perm:
+                        status[f'{str(darwin).upper()}/quotes'] = 'missing'
+                    except all_errors as ex:
+                        print(ex)
+                        status[f'{str(darwin).upper()}/quotes'] = 'failed'
+                
+                month_files = [(month, executor.submit(self.list_ftp_dir, month)) for month in months]
+                
+                for month, future in month_files:
+                    try:
+                        ftp_paths += [f'{month}/{month_file}' for month_file in future.result()
+                                      if month_file.endswith('.csv.gz')]
+                    except all_errors as ex:
+                        print(ex)
+                        status[month] = 'failed'
+            
+            futures = {executor.submit(self.sync_file, ftp_path): ftp_path for ftp_path in ftp_paths}
+            
+            sync_pbar = tqdm(as_completed(futures), total=len(futures), position=0, leave=True)
+            for future in sync_pbar:
+                try:
+                    sync_pbar.set_description("Syncing %s" % futures[future])
+                    status[futures[future]] = future.result()
+                except Exception as ex:
+                    print(ex)
+                    status[futures[future]] = 'failed'
         
-        # Clean up
-        ticks_df.columns = ['timestamp','quote']
-        ticks_df.timestamp = ticks_df.timestamp.apply(pd.to_numeric)
-        ticks_df.set_index('timestamp', drop=True, inplace=True)
-        ticks_df.index = pd.to_datetime(ticks_df.index, unit='ms')
-        ticks_df.quote = ticks_df.quote.apply(pd.to_numeric)
+        counts = pd.Series(status, dtype=object).value_counts().to_dict()
+        tqdm.write(f'\n[KERNEL] Mirror synced: {counts}')
         
-        # Return DataFrame
-        return ticks_df.dropna()
+        failed = [ftp_path for ftp_path in status if status[ftp_path] == 'failed']
+        if failed:
+            tqdm.write(f'[WARNING] {len(failed)} path(s) failed, call sync() again to retry: {failed}')
+        
+        return status
     
     ##########################################################################
+
+    def get_analytics_batch(self, darwins, data_types,
+                            processes=None, # Defaults to os.cpu_count()
+                            long_format=True):
+        
+        """Get analytics for many DARWINs at once, fetching and parsing them
+        in a pool of processes (see get_analytics()).
+        
+        Each worker process opens its own FTP session and shares this
+        instance's mirror_dir and cache_dir.
+        
+        Parameters
+        ----------
+        darwins : list
+            DARWIN ticker symbols, e.g. ['PLF', 'SYO']
+        
+        data_types : str or list
+            Key(s) in self.analytics_headers dictionary.
+        
+        processes : int
+            Number of worker processes.
+        
+        long_format : bool
+            If True, frames of the same data type are concatenated into one
+            DataFrame indexed by (darwin, timestamp). Otherwise a dict of the
+            individual frames is returned.
+        
+        Returns
+        -------
+        df or dict
+            For a single data_type: long DataFrame, or {darwin: df}.
+            For a list of data_types: {data_type: long DataFrame}, or
+            {(darwin, data_type): df}.
+        --
+        """
+        
+        single_type = isinstance(data_types, str)
+        data_types = [data_types] if single_type else list(data_types)
+        
+        frames = {}
+        
+        with ProcessPoolExecutor(max_workers=processes,
+                                 initializer=_init_batch_worker,
+                                 initargs=(self.config, self.mirror_dir, self.cache_dir)) as executor:
+            
+            futures = {executor.submit(_get_batch_analytics, darwin, data_type): (darwin, data_type)
+                       for darwin in darwins for data_type in data_types}
+            
+            batch_pbar = tqdm(as_completed(futures), total=len(futures), position=0, leave=True)
+            for future in batch_pbar:
+                try:
+                    batch_pbar.set_description("Loading %s/%s" % futures[future])
+                    frames[futures[future]] = future.result()
+                except Exception as ex:
+                    print(f'{futures[future]}: {ex}')
+        
+        if not long_format:
+            if single_type:
+                return {darwin: frames[(darwin, data_types[0])]
+                        for darwin in darwins if (darwin, data_types[0]) in frames}
+            return {key: frames[key] for key in futures.values() if key in frames}
+        
+        ret = {}
+        
+        # Concatenate once per data type, in the order DARWINs were given
+        for data_type in data_types:
+            keys = [darwin for darwin in darwins if (darwin, data_type) in frames]
+            ret[data_type] = pd.concat([frames[(darwin, data_type)] for darwin in keys],
+                                       keys=keys, names=['darwin']) if keys else pd.DataFrame()
+        
+        return ret[data_types[0]] if single_type else ret
+    
+    ##########################################################################
+
+# Per-process instance used by get_analytics_batch() workers
+_batch_analytics = None
+
+def _init_batch_worker(config, mirror_dir, cache_dir):
+    
+    global _batch_analytics
+    _batch_analytics = dwx_data_analytics(config, connections=1,
+                                          mirror_dir=mirror_dir, cache_dir=cache_dir)
+
+def _get_batch_analytics(darwin, data_type):
+    return _batch_analytics.get_analytics(darwin, data_type)
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+    AsyncDWX_Info_API.py - DARWIN Info API (asyncio variant of DWX_Info_API)
+    --
+    @author: Darwinex Labs (www.darwinex.com)
+
+    Last Updated: October 18, 2026
+
+    Copyright (c) 2017-2019, Darwinex. All rights reserved.
+
+    Licensed under the BSD 3-Clause License, you may not use this file except
+    in compliance with the License.
+
+    You may obtain a copy of the License at:
+    https://opensource.org/licenses/BSD-3-Clause
+"""
+
+import os, asyncio
+os.chdir('<INSERT-PATH-TO-PROJECT-DIR-HERE>')
+
+from API.dwx_api_async import AsyncDWX_API
+from API.InfoAPI.DWX_Info_API import DWX_Info_API
+
+import pandas as pd
+import numpy as np
+
+"""
+All public methods are coroutines with the same arguments and return values
+as their DWX_Info_API counterparts. Per-DARWIN requests are issued together
+and bounded by _max_concurrency, so _delay is no longer needed between calls.
+With _cache_dir, full quote histories only fetch their missing tail, as in
+DWX_Info_API.
+
+Example Usage:
+
+    async def main():
+        async with AsyncDWX_Info_API(_max_concurrency=32) as _info:
+            _universe = await _info._Get_DARWIN_Universe_()
+            return await _info._Get_Historical_Quotes_(
+                    _symbols=_universe.productName.tolist())
+
+    _quotes = asyncio.run(main())
+"""
+
+class AsyncDWX_Info_API(AsyncDWX_API, DWX_Info_API):
+
+    def __init__(self, _max_concurrency=16, **kwargs):
+        super(AsyncDWX_Info_API, self).__init__(_max_concurrency=_max_concurrency,
+                                                **kwargs)
+
+    #########################################################
+    # Function: Get Quotes for all DARWINs in list _symbols #
+    #########################################################
+
+    async def _Get_Historical_Quotes_(self, _symbols=['THA.4.12','LVS.4.20'],
+                                      _start='',
+                                      _end='',
+                                      _endpoint='/products/{}/history/quotes',
+                                      _plot_title='AsyncDWX_Info_API: def _Get_Quotes_() Example',
+                                      _plot=False):
+
+        if not isinstance(_symbols, list):
+            print('[ERROR] Please specify symbols as Python list []')
+            return None
+
+        async def _get_(darwin):
+
+            try:
+                # Full history requested and cache enabled -> fetch missing tail only
+                if self._cache is not None and _start in ['', np.nan]:
+                    return await self._Get_Quotes_Cached_(darwin, _endpoint)
+
+                _ep = self._Quotes_Endpoint_(darwin, _start, _end, _endpoint)
+                return self._Parse_Quotes_(darwin, await self._Call_API_(_ep, 'GET', ''))
+
+            except Exception as ex:
+
+                print('[ERROR] Something went wrong while looking up ${}'.format(darwin))
+                _exstr = "Exception Type {0}. Args:\n{1!r}"
+                _msg = _exstr.format(type(ex).__name__, ex.args)
+                print(_msg)
+
+        print('[AsyncDarwinInfoAPI] Getting Quotes for {} DARWINs..'.format(len(_symbols)))
+
+        _dfs = await asyncio.gather(*[_get_(darwin) for darwin in _symbols])
+
+        _retdf = pd.concat([_df for _df in _dfs if isinstance(_df, pd.DataFrame)], axis=1)
+
+        if _plot:
+            self._graphics._plotly_dataframe_scatter_(_custom_filename='example_quotes.html',
+                                                      _dir_prefix='MISC/',
+                                                      _df=_retdf,
+                                                      _x_title='EOD Timestamp',
+                                                      _y_title='DARWIN Quote',
+                                                      _main_title=_plot_title)
+
+        return _retdf
+
+    #########################################################################
+
+    async def _Get_Quotes_Cached_(self, _darwin, _endpoint='/products/{}/history/quotes'):
+
+        _last, _ep = self._Cached_Quotes_Endpoint_(_darwin, _endpoint)
+
+        return self._Update_Quotes_Cache_(_darwin, _last, _ep,
+                                          await self._Call_API_(_ep, 'GET', '') if _ep is not None else None)
+
+    #########################################################################
+
+    async def _Get_Historical_Scores_(self,
+                                      _symbols=['THA.4.12','LVS.4.20'],
+                                      _endpoint='/products/{}/history/badges',
+                                      _plot_title='AsyncDWX_Info_API: def _Get_Historical_Scores_() Example',
+                                      _plot=False,
+                                      _long_format=False):
+
+        if not isinstance(_symbols, list):
+            print('[ERROR] Please specify symbols as Python list []')
+            return None
+
+        async def _get_(darwin):
+
+            try:
+                return self._Parse_Scores_(await self._Call_API_(_endpoint.format(darwin), 'GET', ''))
+
+            except Exception as ex:
+
+                print('[ERROR] Something went wrong while looking up ${}'.format(darwin))
+                _exstr = "Exception Type {0}. Args:\n{1!r}"
+                _msg = _exstr.format(type(ex).__name__, ex.args)
+                print(_msg)
+
+        print('[AsyncDarwinInfoAPI] Getting Scores for {} DARWINs..'.format(len(_symbols)))
+
+        _dfs = await asyncio.gather(*[_get_(darwin) for darwin in _symbols])
+
+        _dict = {darwin: _df for darwin, _df in zip(_symbols, _dfs) if _df is not None}
+
+        # If only one symbol provided, plot scores via Plotly
+        if len(_symbols) == 1 and _plot and _symbols[0] in _dict:
+            self._graphics._plotly_dataframe_scatter_(_custom_filename='example_scores.html',
+                                                      _dir_prefix='MISC/',
+                                                      _df=_dict[_symbols[0]].drop(['fcal_ts','lcal_ts','Ds','Dp'],
+                                                               axis=1).loc[:, ],
+                                                      _x_title='EOD Timestamp',
+                                                      _y_title='Score / Investment Attribute',
+                                                      _main_title=_plot_title)
+
+        if _long_format:
+            return self._Stack_Scores_(_dict)
+
+        return _dict
+
+    #########################################################################
+
+    async def _Get_DARWIN_Universe_(self,
+                                    _status='ALL',
+                                    _endpoint='/products{}',
+                                    _query_string='?status={}&page={}&per_page={}',
+                                    _page=0,
+                                    _perPage=50,
+                                    _iterate=True):
+
+        # Get first batch to learn the number of pages
+        print('[AsyncDarwinInfoAPI] Getting first {} DARWINs..'.format(_perPage))
+        _darwins = await self._Call_API_(_endpoint.format(_query_string.format(_status, _page, _perPage)),
+                                         _type='GET',
+                                         _data='')
+
+        if _darwins is None:
+            return None
+
+        if not _iterate:
+            return pd.DataFrame(_darwins)
+
+        _pages = int(_darwins['totalPages'])
+
+        print('[API] {} pages of {} DARWINs each found.. fetching concurrently, stand by! :muscle:\n'
+              .format(_pages, _perPage))
+
+        _rest = await asyncio.gather(*[self._Call_API_(_endpoint.format(_query_string.format(_status, i, _perPage)),
+                                                       _type='GET',
+                                                       _data='')
+                                       for i in range(_page + 1, _pages)])
+
+        # Merge in page order, skipping failed pages
+        _records = list(_darwins['content'])
+
+        for _ret in _rest:
+            if _ret is not None:
+                _records.extend(_ret['content'])
+
+        return pd.DataFrame(_records)
+
+    #########################################################################
+
+    async def _Get_Filtered_DARWINS_(self,
+                                     _endpoint='/products',
+                                     _filters=[['drawdown',-10,0,'6m'],
+                                               ['return',5,100,'1m']],
+                                     _order=['return','12m','DESC'],
+                                     _page=0,
+                                     _perPage=50):
+
+        _rets = []
+
+        # Page count is unknown up front, so pages are walked in sequence
+        while True:
+
+            print('\r[AsyncDarwinInfoAPI] Getting page {} of DARWINs that satisfy criteria..' \
+                  .format(_page), end='', flush=True)
+
+            _ret = await self._Call_API_(_endpoint,
+                                         _type='POST',
+                                         _data=self._Filter_Data_(_filters, _order, _page, _perPage))
+
+            # An empty list marks the last page, anything else is an error
+            if not isinstance(_ret, list):
+                print('\n[WARNING] Page {} of DARWINs failed ({!r}), results are incomplete' \
+                      .format(_page, _ret))
+                break
+
+            if len(_ret) == 0:
+                break
+
+            _rets.extend(_ret)
+            _page += 1
+
+        return pd.DataFrame(_rets)
+
+    #########################################################################
+
+    async def _Get_DARWIN_OHLC_Candles_(self,
+                                        _symbols=['KVL'],
+                                        _resolution='1m', # 1m, 5m, 15m, 30m, 1h, 4h, 1d, 1w, 1mn
+                                        _from_dt='2019-05-31 12:00:00', # UTC
+                                        _to_dt=str(pd.Timestamp('now')),
+                                        _timeframe='/1D', # 1D, 1W, 1M, 3M, 6M, 1Y, 2Y, ALL
+                                        _endpoint='/products/{}/candles{}',
+                                        _chunk_candles=1440): # Max. candles per request for _from_dt / _to_dt ranges
+
+        _query_strings = self._Candles_Query_Strings_(_resolution, _from_dt, _to_dt,
+                                                      _timeframe, _chunk_candles)
+
+        if len(_query_strings) == 0:
+            return None
+
+        async def _get_(darwin, _query_string):
+
+            try:
+                return self._Parse_Candles_(await self._Call_API_(_endpoint.format(darwin, _query_string),
+                                                                  _type='GET',
+                                                                  _data=''))
+            except Exception as ex:
+                print('[ERROR] Something went wrong while looking up ${}'.format(darwin))
+                _exstr = "Exception Type {0}. Args:\n{1!r}"
+                _msg = _exstr.format(type(ex).__name__, ex.args)
+                print(_msg)
+
+        print('[AsyncDarwinInfoAPI] Getting Candles for {} DARWINs, {} request(s) each..'
+              .format(len(_symbols), len(_query_strings)))
+
+        # Chunks of all DARWINs at once, bounded by _max_concurrency
+        _dfs = await asyncio.gather(*[_get_(darwin, _query_string) for darwin in _symbols
+                                                                   for _query_string in _query_strings])
+
+        # As DWX_Info_API, a DARWIN with a missing chunk is left out
+        _candles = {}
+
+        for _i, darwin in enumerate(_symbols):
+
+            _chunks = _dfs[_i * len(_query_strings):(_i + 1) * len(_query_strings)]
+
+            if any(_df is None for _df in _chunks):
+                print('[WARNING] Candles for ${} incomplete, skipping'.format(darwin))
+                continue
+
+            _candles[darwin] = self._Merge_Candles_(_chunks)
+
+        return _candles
+
+    #########################################################################
@@ -15,10 +15,14 @@
     https://opensource.org/licenses/BSD-3-Clause
 """
 
-import os, time
+import os, time, itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 os.chdir('<INSERT-PATH-TO-PROJECT-DIR-HERE>')
 
 from MINIONS.dwx_graphics_helpers import DWX_Graphics_Helpers
+from MINIONS.dwx_quote_cache import DWX_Quote_Cache
+from MINIONS.dwx_rate_limiter import DWX_Rate_Limiter
 from API.dwx_api import DWX_API
 
 import pandas as pd
@@ -29,10 +33,158 @@ pd.set_option('display.max_columns', 500)
 
 class DWX_Info_API(DWX_API):
     
-    def __init__(self, **kwargs):
+    # Column names for /products/{}/history/badges rows
+    _badge_cols = ['eod_ts','Dp','Ex','Mc','Rs', 
+                   'Ra','Os','Cs','Rp','Rm',
+                   'Dc','La','Pf','Cp','Ds',
+                   'fcal_ts','lcal_ts']
+    
+    # Seconds per candle, for sizing chunked /products/{}/candles requests
+    _candle_seconds = {'1m': 60, '5m': 300, '15m': 900, '30m': 1800,
+                       '1h': 3600, '4h': 14400, '1d': 86400,
+                       '1w': 604800, '1mn': 2678400}
+    
+    def __init__(self, _cache_dir=None, **kwargs):
         super(DWX_Info_API, self).__init__(**kwargs)
         self._graphics = DWX_Graphics_Helpers()
         
+        # Optional on-disk quote history cache, e.g. _cache_dir='DATA/QUOTES'
+        self._cache = DWX_Quote_Cache(_cache_dir) if _cache_dir is not None else None
+        
+    #########################################################################
+    # Endpoint construction and JSON -> DataFrame parsing, shared by the    #
+    # synchronous methods below and by AsyncDWX_Info_API.                   #
+    #########################################################################
+    
+    def _Quotes_Endpoint_(self, _darwin, _start='', _end='', 
+                          _endpoint='/products/{}/history/quotes'):
+        
+        # If dates provided, attach query parameters to endpoint
+        if _start not in ['', np.nan]:
+            
+            return _endpoint.format(_darwin) + '?start={}&end={}'.format(
+                                int(_start.timestamp())*1000, 
+                                int(_end.timestamp())*1000)
+        
+        return _endpoint.format(_darwin)
+    
+    def _Parse_Quotes_(self, _darwin, _data):
+        
+        _df = pd.DataFrame(data=_data)
+        
+        # Assign column names
+        _df.columns = ['timestamp', _darwin]
+        
+        # Convert ms timestamp to datetime
+        _df.timestamp = pd.to_datetime(_df.timestamp, unit='ms')
+        
+        # Crop to data before today's date
+        _df = _df[_df.timestamp.dt.date < pd.to_datetime('today').date()]
+        
+        # Set index to timestamp
+        return _df.set_index('timestamp')
+    
+    def _Parse_Scores_(self, _data):
+        
+        # Flatten [eod_ts, Dp, [Ex .. Ds], fcal_ts, lcal_ts] rows into one
+        # (rows x 17) float array in a single pass, nulls become NaN
+        _values = np.array(list(itertools.chain.from_iterable(
+                                _row[:2] + _row[2] + _row[-2:] for _row in _data)),
+                           dtype=np.float64).reshape(-1, len(self._badge_cols))
+        
+        # Convert the three ms timestamp columns to datetime at once
+        _ts = pd.to_datetime(_values[:, [0, -2, -1]].ravel(), unit='ms').values.reshape(-1, 3)
+        
+        # Index on eod_ts
+        _df = pd.DataFrame(_values[:, 1:-2], 
+                           columns=self._badge_cols[1:-2],
+                           index=pd.DatetimeIndex(_ts[:, 0], name='eod_ts'))
+        
+        _df['fcal_ts'] = _ts[:, 1]
+        _df['lcal_ts'] = _ts[:, 2]
+        
+        return _df
+    
+    def _Stack_Scores_(self, _dict):
+        
+        # One long DataFrame indexed by (darwin, eod_ts)
+        if len(_dict) == 0:
+            return pd.DataFrame(columns=self._badge_cols[1:])
+        
+        return pd.concat(_dict, names=['darwin'])
+    
+    def _Candles_Query_String_(self, _resolution='1m', _from_dt='', 
+                               _to_dt='', _timeframe=''):
+        
+        # from/to endpoint given priority. change as necessary.
+        
+        if _from_dt != '':
+            
+            # Convert human-readable datetimes to millisecond EPOCHs
+            _from_epoch = int(pd.Timestamp(_from_dt).timestamp())
+            _to_epoch = int(pd.Timestamp(_to_dt).timestamp())
+        
+            return f'?resolution={_resolution}&from={_from_epoch}&to={_to_epoch}'
+        
+        elif _timeframe != '':
+            return f'{_timeframe}?resolution={_resolution}'
+        
+        print('[KERNEL] Inputs not recognized.. please try again.')
+        return None
+    
+    def _Candles_Query_Strings_(self, _resolution='1m', _from_dt='', 
+                                _to_dt='', _timeframe='', _chunk_candles=1440):
+        
+        # Timeframe requests (and unknown resolutions) are not split
+        if _from_dt == '' or _resolution not in self._candle_seconds:
+            
+            _query_string = self._Candles_Query_String_(_resolution, _from_dt, 
+                                                        _to_dt, _timeframe)
+            
+            return [] if _query_string is None else [_query_string]
+        
+        _from_epoch = int(pd.Timestamp(_from_dt).timestamp())
+        _to_epoch = int(pd.Timestamp(_to_dt).timestamp())
+        
+        # At most _chunk_candles candles per request
+        _step = _chunk_candles * self._candle_seconds[_resolution]
+        
+        return [f'?resolution={_resolution}&from={_start}&to={min(_start + _step, _to_epoch)}'
+                for _start in range(_from_epoch, max(_to_epoch, _from_epoch + 1), _step)]
+    
+    def _Merge_Candles_(self, _dfs):
+        
+        _df = pd.concat(_dfs)
+        
+        # Adjacent chunks share their boundary candle
+        return _df[~_df.index.duplicated(keep='last')].sort_index()
+    
+    def _Filter_Data_(self, _filters, _order, _page, _perPage):
+        
+        # Construct filter
+        _json = dict(filter=[dict(name=_filters[i][0],
+                                  options=[dict(max=_filters[i][2],
+                                                min=_filters[i][1],
+                                                period=_filters[i][3])]) \
+                            for i in range(len(_filters))],
+                     order=_order[2],
+                     orderField=_order[0],
+                     page=_page,
+                     perPage=_perPage,
+                     period=_order[1])
+        
+        return str(_json).replace('\'', '"')
+    
+    def _Parse_Candles_(self, _d):
+        
+        _df = pd.DataFrame(data=[_row['candle'] for _row in _d['candles']],
+                           index=[_row['timestamp'] for _row in _d['candles']])
+        
+        # Convert timestamp EPOCHs to human-readable datetimes
+        _df.index = pd.to_datetime(_df.index, unit='s')
+        
+        return _df
+    
     #########################################################    
     # Function: Get Quotes for all DARWINs in list _symbols #
     #########################################################
@@ -43,62 +195,64 @@ class DWX_Info_API(DWX_API):
                                _endpoint='/products/{}/history/quotes',
                                _plot_title='DWX_Info_API: def _Get_Quotes_() Example',
                                _plot=False,
-                               _delay=0.01):
+                               _delay=0,
+                               _parallel=False,  # Fetch DARWINs on a thread pool
+                               _max_workers=8,   # Thread pool size if _parallel
+                               _rate_limit=0):   # Max. requests/sec if _parallel (0 = no limit)
         
         if isinstance(_symbols, list):
             
             _dict = {}
             _count = 1
             
-            for darwin in _symbols:
+            if _parallel:
                 
-                print('\r[DarwinInfoAPI] Getting Quotes for DARWIN {} / {}: ${}'.format(_count, len(_symbols), darwin), 
-                      end='', flush=True)
+                # Optional per-call cap on top of the shared self._limiter
+                _throttle = DWX_Rate_Limiter(_rate=_rate_limit, _burst=1, 
+                                             _adaptive=False) if _rate_limit > 0 else None
                 
-                try:
-                    
-                    # If dates provided, attach query parameters to endpoint
-                    if _start not in ['', np.nan]:
-                        
-                        _ep = _endpoint.format(darwin) + '?start={}&end={}'.format(
-                                        int(_start.timestamp())*1000, 
-                                        int(_end.timestamp())*1000)
+                def _get_(darwin):
+                    if _throttle is not None:
+                        _throttle._acquire_()
+                    return self._Get_Quotes_Single_(darwin, _start, _end, _endpoint)
+                
+                with ThreadPoolExecutor(max_workers=_max_workers) as _pool:
                     
-                    else:
-                        _ep = _endpoint.format(darwin)
+                    _futures = {_pool.submit(_get_, darwin): darwin for darwin in _symbols}
                     
-                    # Construct DataFrame from returned JSON
-                    _dict[darwin] = pd.DataFrame(data=self._Call_API_(_ep, 'GET', ''))
-                            
-                    # Assign column names
-                    _dict[darwin].columns = ['timestamp', darwin]
+                    # Collect in completion order
+                    for _future in as_completed(_futures):
+                        
+                        darwin = _futures[_future]
+                        
+                        print('\r[DarwinInfoAPI] Got Quotes for DARWIN {} / {}: ${}'.format(_count, len(_symbols), darwin), 
+                              end='', flush=True)
+                        
+                        _dict[darwin] = _future.result()
+                        _count += 1
+            
+            else:
+                
+                for darwin in _symbols:
                     
-                    # Convert ms timestamp to datetime
-                    _dict[darwin].timestamp = pd.to_datetime(_dict[darwin].timestamp, unit='ms')
+                    print('\r[DarwinInfoAPI] Getting Quotes for DARWIN {} / {}: ${}'.format(_count, len(_symbols), darwin), 
+                          end='', flush=True)
                     
-                    # Crop to data before today's date
-                    _dict[darwin] = _dict[darwin][_dict[darwin].timestamp.dt.date < pd.to_datetime('today').date()]
+                    _dict[darwin] = self._Get_Quotes_Single_(darwin, _start, _end, _endpoint)
                     
-                    # Set index to timestamp
-                    _dict[darwin] = _dict[darwin].set_index('timestamp')
+                    if _dict[darwin] is None:
+                        continue
                     
                     # Sleep
                     if _delay > 0:
                         time.sleep(_delay)
                     
-                except Exception as ex:
-                    
-                    print('[ERROR] Something went wrong while looking up ${}'.format(darwin))
-                    _exstr = "Exception Type {0}. Args:\n{1!r}"
-                    _msg = _exstr.format(type(ex).__name__, ex.args)
-                    print(_msg)
-                    continue
-                
-                # Update counter
-                _count += 1
-                    
-            _retdf = pd.concat([_df for _df in _dict.values() if isinstance(_df, pd.DataFrame)], axis=1)
-            _retdf.columns = _symbols
+                    # Update counter
+                    _count += 1
+            
+            # Wide DataFrame, columns in the order requested
+            _retdf = pd.concat([_dict[darwin] for darwin in _symbols 
+                                if isinstance(_dict.get(darwin), pd.DataFrame)], axis=1)
             
             if _plot:
                 self._graphics._plotly_dataframe_scatter_(_custom_filename='example_quotes.html', 
@@ -113,7 +267,91 @@ class DWX_Info_API(DWX_API):
         else:
             print('[ERROR] Please specify symbols as Python list []')    
         
-                     
+    #########################################################################
+    
+    def _Get_Quotes_Single_(self, _darwin, _start='', _end='', 
+                            _endpoint='/products/{}/history/quotes'):
+        
+        try:
+            
+            # Full history requested and cache enabled -> fetch missing tail only
+            if self._cache is not None and _start in ['', np.nan]:
+                return self._Get_Quotes_Cached_(_darwin, _endpoint)
+            
+            _ep = self._Quotes_Endpoint_(_darwin, _start, _end, _endpoint)
+            
+            # Construct DataFrame from returned JSON
+            return self._Parse_Quotes_(_darwin, self._Call_API_(_ep, 'GET', ''))
+            
+        except Exception as ex:
+            
+            print('[ERROR] Something went wrong while looking up ${}'.format(_darwin))
+            _exstr = "Exception Type {0}. Args:\n{1!r}"
+            _msg = _exstr.format(type(ex).__name__, ex.args)
+            print(_msg)
+    
+    #########################################################################
+    
+    def _Get_Quotes_Cached_(self, _darwin, _endpoint='/products/{}/history/quotes'):
+        
+        _last, _ep = self._Cached_Quotes_Endpoint_(_darwin, _endpoint)
+        
+        return self._Update_Quotes_Cache_(_darwin, _last, _ep,
+                                          self._Call_API_(_ep, 'GET', '') if _ep is not None else None)
+    
+    # Split around the one API call, so AsyncDWX_Info_API can await it
+    def _Cached_Quotes_Endpoint_(self, _darwin, _endpoint):
+        
+        """Last cached timestamp and the endpoint of the missing tail, None if
+        the cache is up to date."""
+        
+        _last = self._cache._last_timestamp_(_darwin)
+        _yesterday = (pd.to_datetime('today') - pd.Timedelta(days=1)).date()
+        
+        # Nothing cached yet -> full history
+        if _last is None:
+            _ep = self._Quotes_Endpoint_(_darwin, '', '', _endpoint)
+        
+        # Cache only holds completed days, so yesterday means up to date
+        elif pd.to_datetime(_last, unit='ms').date() >= _yesterday:
+            _ep = None
+        
+        # Request only what came after the last cached quote
+        else:
+            _ep = self._Quotes_Endpoint_(_darwin, 
+                                         pd.to_datetime(_last + 1, unit='ms'),
+                                         pd.Timestamp.now(tz='UTC'),
+                                         _endpoint)
+        
+        return _last, _ep
+    
+    def _Update_Quotes_Cache_(self, _darwin, _last, _ep, _data):
+        
+        """Append the _data returned for _ep to the cache, return all quotes."""
+        
+        if _ep is None:
+            _ts, _quotes = self._cache._load_(_darwin, _mmap=False)
+        
+        else:
+            if _data is None and _last is not None:
+                print('\n[WARNING] Could not update ${}, using cached quotes only'.format(_darwin))
+                _ts, _quotes = self._cache._load_(_darwin, _mmap=False)
+            
+            elif _data is not None and len(_data) == 0:
+                _ts, _quotes = self._cache._append_(_darwin, [], [])
+            
+            else:
+                _df = self._Parse_Quotes_(_darwin, _data)
+                _ts, _quotes = self._cache._append_(_darwin, 
+                                                    _df.index.values.astype('datetime64[ms]').astype(np.int64),
+                                                    _df[_darwin].values)
+        
+        # Same shape as _Parse_Quotes_() output
+        _df = pd.DataFrame({_darwin: _quotes}, index=pd.to_datetime(_ts, unit='ms'))
+        _df.index.name = 'timestamp'
+        
+        return _df
+    
     ######################################################################### 
     
     def _Get_Historical_Scores_(self, 
@@ -121,19 +359,14 @@ class DWX_Info_API(DWX_API):
                                 _endpoint='/products/{}/history/badges',
                                 _plot_title='DWX_Info_API: def _Get_Historical_Scores_() Example',
                                 _plot=False,
-                                _delay=0.01):
+                                _delay=0,
+                                _long_format=False): # One (darwin, eod_ts) DataFrame, not {darwin: DataFrame}
         
         if isinstance(_symbols, list):
             
             _dict = {}
             _count = 1
             
-            # Badges dict for later use
-            _badge_cols = ['eod_ts','Dp','Ex','Mc','Rs', 
-                            'Ra','Os','Cs','Rp','Rm',
-                            'Dc','La','Pf','Cp','Ds',
-                            'fcal_ts','lcal_ts']
-            
             for darwin in _symbols:
                 
                 print('\r[DarwinInfoAPI] Getting Scores for DARWIN {} / {}: ${}'.format(_count, len(_symbols), darwin),
@@ -142,23 +375,7 @@ class DWX_Info_API(DWX_API):
                 try:
             
                     # Construct DataFrame from returned JSON
-                    _dict[darwin] = self._Call_API_(_endpoint.format(darwin), 'GET', '')
-                          
-                    _dict[darwin] = [_dict[darwin][i][:2] + [x for x in _dict[darwin][i][2]] + _dict[darwin][i][-2:] for i in range(len(_dict[darwin]))]
-                    
-                    
-                    _dict[darwin] = pd.DataFrame(data=_dict[darwin], index=[_dict[darwin][i][0] for i in range(len(_dict[darwin]))])
-        
-                    # Assign column names
-                    _dict[darwin].columns = _badge_cols
-                    
-                    # Convert ms timestamp to datetime
-                    _dict[darwin].eod_ts = pd.to_datetime(_dict[darwin].eod_ts, unit='ms')
-                    _dict[darwin].fcal_ts = pd.to_datetime(_dict[darwin].fcal_ts, unit='ms')
-                    _dict[darwin].lcal_ts = pd.to_datetime(_dict[darwin].lcal_ts, unit='ms')
-                    
-                    # Set index to eod_ts
-                    _dict[darwin] = _dict[darwin].set_index('eod_ts')
+                    _dict[darwin] = self._Parse_Scores_(self._Call_API_(_endpoint.format(darwin), 'GET', ''))
                     
                     # Sleep
                     if _delay > 0:
@@ -186,6 +403,9 @@ class DWX_Info_API(DWX_API):
                                                               _x_title='EOD Timestamp',
                                                               _y_title='Score / Investment Attribute',
                                                               _main_title=_plot_title)
+            
+            if _long_format:
+                return self._Stack_Scores_(_dict)
                 
             return _dict
         
@@ -201,16 +421,21 @@ class DWX_Info_API(DWX_API):
                           _page=0,
                           _perPage=50,
                           _iterate=True,
-                          _delay=0.01):
+                          _delay=0,
+                          _parallel=True,   # Fetch remaining pages on a thread pool
+                          _max_workers=8):  # Thread pool size if _parallel
+        
+        def _get_page_(i):
+            return self._Call_API_(_endpoint \
+                                  .format(_query_string \
+                                          .format(_status, i, _perPage)), 
+                                          _type='GET',
+                                          _data='')
     
         # Get first batch
         try:
             print('[DarwinInfoAPI] Getting first {} DARWINs..'.format(_perPage))
-            _darwins = self._Call_API_(_endpoint \
-                                      .format(_query_string \
-                                              .format(_status, _page, _perPage)), 
-                                              _type='GET',
-                                              _data='')
+            _darwins = _get_page_(_page)
             
         except Exception as ex:
             _exstr = "Exception Type {0}. Args:\n{1!r}"
@@ -223,33 +448,53 @@ class DWX_Info_API(DWX_API):
             # Calculate number of pages
             _pages = int(_darwins['totalPages'])
             
-            # Keep 'content' list of DARWINs, discard everything else
-            _darwins = _darwins['content']
+            # Keep 'content' list of DARWINs per page, discard everything else
+            _contents = {_page: _darwins['content']}
             
             print('[API] {} pages of {} DARWINs each found.. iterating, stand by! :muscle:\n'
                   .format(_pages, _perPage))
             
-            # Iterate
-            for i in range(_page + 1, _pages):
+            if _parallel:
                 
-                print('\r[DarwinInfoAPI] Getting page {} of {}'.format(i+1, _pages), end='', flush=True)
+                with ThreadPoolExecutor(max_workers=_max_workers) as _pool:
                 
-                try:
-                    _darwins = _darwins + self._Call_API_(_endpoint \
-                                              .format(_query_string \
-                                                      .format(_status, i, _perPage)), 
-                                                      _type='GET',
-                                                      _data='')['content']
+                    _futures = {_pool.submit(_get_page_, i): i for i in range(_page + 1, _pages)}
                     
-                    # Sleep my child.. until next time..
-                    if _delay > 0:
-                        time.sleep(_delay)
+                    # Collect in completion order, merged in page order below
+                    for _count, _future in enumerate(as_completed(_futures), start=2):
                     
-                except Exception as ex:
-                    _exstr = "Exception Type {0}. Args:\n{1!r}"
-                    _msg = _exstr.format(type(ex).__name__, ex.args)
-                    print(_msg)
-                    continue
+                        print('\r[DarwinInfoAPI] Got page {} of {}'.format(_count, _pages), end='', flush=True)
+                        
+                        try:
+                            _contents[_futures[_future]] = _future.result()['content']
+                        
+                        except Exception as ex:
+                            _exstr = "Exception Type {0}. Args:\n{1!r}"
+                            _msg = _exstr.format(type(ex).__name__, ex.args)
+                            print(_msg)
+            
+            else:
+                
+                # Iterate
+                for i in range(_page + 1, _pages):
+                    
+                    print('\r[DarwinInfoAPI] Getting page {} of {}'.format(i+1, _pages), end='', flush=True)
+                    
+                    try:
+                        _contents[i] = _get_page_(i)['content']
+                        
+                        # Sleep my child.. until next time..
+                        if _delay > 0:
+                            time.sleep(_delay)
+                    
+                    except Exception as ex:
+                        _exstr = "Exception Type {0}. Args:\n{1!r}"
+                        _msg = _exstr.format(type(ex).__name__, ex.args)
+                        print(_msg)
+                        continue
+            
+            # Build the DataFrame once, from all records in page order
+            return pd.DataFrame(list(itertools.chain.from_iterable(_contents[i] for i in sorted(_contents))))
                 
         # Return dict
         return pd.DataFrame(_darwins)
@@ -287,6 +532,11 @@ class DWX_Info_API(DWX_API):
                                _order=['return','12m','DESC'],
                                _page=0,
                                _perPage=50)
+    
+    # 3 - one DataFrame per page as it arrives, next 2 pages prefetched
+    for _batch in _info._Iter_Filtered_DARWINS_(_filters=[['d-score',50,100,'actual']],
+                                                _prefetch=2):
+        _info._Get_Historical_Quotes_(_symbols=_batch.productName.tolist())
     """ 
     
     def _Get_Filtered_DARWINS_(self, 
@@ -296,52 +546,105 @@ class DWX_Info_API(DWX_API):
                                _order=['return','12m','DESC'],
                                _page=0,
                                _perPage=50,
-                               _delay=0.01):
+                               _delay=0,
+                               _prefetch=0):
         
-        # Construct filter
-        _json = dict(filter=[dict(name=_filters[i][0],
-                                  options=[dict(max=_filters[i][2],
-                                                min=_filters[i][1],
-                                                period=_filters[i][3])]) \
-                            for i in range(len(_filters))],
-                     order=_order[2],
-                     orderField=_order[0],
-                     page=_page,
-                     perPage=_perPage,
-                     period=_order[1])
+        try:
+            _batches = list(self._Iter_Filtered_DARWINS_(_endpoint, _filters, _order,
+                                                         _page, _perPage, _delay, _prefetch))
+    
+        except AssertionError:
+            print('[ERROR] name, period, min and max lists must be the same length.')
+            return None
+        
+        # Return DataFrame
+        return pd.concat(_batches, ignore_index=True) if len(_batches) > 0 else pd.DataFrame()
+    
+    #########################################################################
     
-        _rets = []
+    def _Iter_Filtered_DARWINS_(self, 
+                                _endpoint='/products',
+                                _filters=[['drawdown',-10,0,'6m'],
+                                          ['return',5,100,'1m']],
+                                _order=['return','12m','DESC'],
+                                _page=0,
+                                _perPage=50,
+                                _delay=0,
+                                _prefetch=0):  # Pages requested ahead on a thread pool
+        
+        """Generator form of _Get_Filtered_DARWINS_(), yielding a DataFrame
+        per page as soon as it arrives. With _prefetch=k the next k pages are
+        requested speculatively while the current one is being consumed;
+        requests beyond the last page are simply discarded. A page that fails
+        ends the iteration with a warning naming it."""
+        
+        def _get_page_(page):
+            return self._Call_API_(_endpoint,
+                                   _type='POST',
+                                   _data=self._Filter_Data_(_filters, _order, page, _perPage))
+        
+        def _failed_(page, _ret):
+            
+            # An empty list marks the last page, anything else is an error
+            if isinstance(_ret, list):
+                return False
+            
+            print('\n[WARNING] Page {} of DARWINs failed ({!r}), results are incomplete' \
+                  .format(page, _ret))
+            return True
         
         # Execute
-        while _json['page'] != -1:
+        if _prefetch <= 0:
             
-            print('\r[DarwinInfoAPI] Getting page {} of DARWINs that satisfy criteria..' \
-                  .format(_json['page']), end='', flush=True)
+            while True:
+                
+                print('\r[DarwinInfoAPI] Getting page {} of DARWINs that satisfy criteria..' \
+                      .format(_page), end='', flush=True)
+                
+                _ret = _get_page_(_page)
+                
+                if _failed_(_page, _ret) or len(_ret) == 0:
+                    break # done
+                
+                yield pd.DataFrame(_ret)
+                
+                # Update page number
+                _page += 1
+                
+                # Sleep between calls
+                if _delay > 0:
+                    time.sleep(_delay)
+            
+            return
+        
+        with ThreadPoolExecutor(max_workers=_prefetch + 1) as _pool:
+            
+            _pending = deque(_pool.submit(_get_page_, _p) for _p in range(_page, _page + _prefetch + 1))
+            _next = _page + _prefetch + 1
             
             try:
-                _ret = self._Call_API_(_endpoint,
-                                      _type='POST',
-                                      _data=str(_json).replace('\'', '"'))
+                while len(_pending) > 0:
                 
-                if len(_ret) > 0:
+                    _current = _next - len(_pending)
                     
-                    # Update page number
-                    _json['page'] += 1
+                    print('\r[DarwinInfoAPI] Getting page {} of DARWINs that satisfy criteria..' \
+                          .format(_current), end='', flush=True)
                     
-                    # Add output to running list
-                    _rets = _rets + _ret
+                    _ret = _pending.popleft().result()
                     
-                    # Sleep between calls
-                    time.sleep(_delay)
-                else:
-                    _json['page'] = -1 # done
+                    if _failed_(_current, _ret) or len(_ret) == 0:
+                        break # done
+                    
+                    # Keep _prefetch pages in flight
+                    _pending.append(_pool.submit(_get_page_, _next))
+                    _next += 1
                 
-            except AssertionError:
-                print('[ERROR] name, period, min and max lists must be the same length.')
-                return None
+                    yield pd.DataFrame(_ret)
        
-        # Return DataFrame
-        return pd.DataFrame(_rets)
+            # Done, or the caller stopped early
+            finally:
+                for _future in _pending:
+                    _future.cancel()
     
     ######################################################################### 
 
@@ -368,51 +671,92 @@ class DWX_Info_API(DWX_API):
                              _to_dt=str(pd.Timestamp('now')),
                              _timeframe='/1D', # 1D, 1W, 1M, 3M, 6M, 1Y, 2Y, ALL
                              _endpoint='/products/{}/candles{}',
-                             _delay=0.01):
+                             _delay=0,
+                             _chunk_candles=1440, # Max. candles per request for _from_dt / _to_dt ranges
+                             _parallel=True,      # Fetch chunks of all DARWINs on a thread pool
+                             _max_workers=8):     # Thread pool size if _parallel
     
-        # from/to endpoint given priority. change as necessary.
+        _query_strings = self._Candles_Query_Strings_(_resolution, _from_dt, _to_dt,
+                                                      _timeframe, _chunk_candles)
         
-        if _from_dt != '':
+        if len(_query_strings) == 0:
+            return None
             
-            # Convert human-readable datetimes to millisecond EPOCHs
-            _from_epoch = int(pd.Timestamp(_from_dt).timestamp())
-            _to_epoch = int(pd.Timestamp(_to_dt).timestamp())
+        def _get_chunk_(_darwin, _query_string):
+            
+            _d = self._Call_API_(_endpoint \
+                                      .format(_darwin, 
+                                              _query_string), 
+                                              _type='GET',
+                                              _data='')
+            
+            # Parse data into DataFrame
+            return self._Parse_Candles_(_d)
         
-            _query_string = f'?resolution={_resolution}&from={_from_epoch}\
-                             &to={_to_epoch}'
+        _tasks = [(_darwin, _query_string) for _darwin in _symbols 
+                                           for _query_string in _query_strings]
         
-        elif _timeframe != '':
-            _query_string = f'{_timeframe}?resolution={_resolution}'
+        _chunks = {_darwin: [] for _darwin in _symbols}
+        _failed = set()
+        
+        print('[DarwinInfoAPI] Getting Candles for {} DARWINs, {} request(s) each..'
+              .format(len(_symbols), len(_query_strings)))
+        
+        if _parallel:
+            
+            with ThreadPoolExecutor(max_workers=_max_workers) as _pool:
+                
+                _futures = {_pool.submit(_get_chunk_, *_task): _task for _task in _tasks}
+                
+                # Collect in completion order, sorted on merge below
+                for _count, _future in enumerate(as_completed(_futures), start=1):
+                    
+                    _darwin = _futures[_future][0]
+                    
+                    print('\r[DarwinInfoAPI] Got chunk {} of {}'.format(_count, len(_tasks)), 
+                          end='', flush=True)
+                    
+                    try:
+                        _chunks[_darwin].append(_future.result())
+                    
+                    except Exception as ex:
+                        _failed.add(_darwin)
+                        print('[ERROR] Something went wrong while looking up ${}'.format(_darwin))
+                        _exstr = "Exception Type {0}. Args:\n{1!r}"
+                        _msg = _exstr.format(type(ex).__name__, ex.args)
+                        print(_msg)
         
         else:
-            print('[KERNEL] Inputs not recognized.. please try again.')
-            return None
             
+            for _darwin, _query_string in _tasks:
+                
+                if _darwin in _failed:
+                    continue
+                
+                try:
+                    _chunks[_darwin].append(_get_chunk_(_darwin, _query_string))
+                    
+                    # Sleep
+                    if _delay > 0:
+                        time.sleep(_delay)
+                
+                except Exception as ex:
+                    _failed.add(_darwin)
+                    print('[ERROR] Something went wrong while looking up ${}'.format(_darwin))
+                    _exstr = "Exception Type {0}. Args:\n{1!r}"
+                    _msg = _exstr.format(type(ex).__name__, ex.args)
+                    print(_msg)
+        
+        # A DARWIN with a missing chunk is left out, not returned with a gap
         _candles = {}
         
         for _darwin in _symbols:
             
-            try:
-                print('[DarwinInfoAPI] Getting Candles for {}..'.format(_darwin))
-                _d = self._Call_API_(_endpoint \
-                                          .format(_darwin, 
-                                                  _query_string), 
-                                                  _type='GET',
-                                                  _data='')
-                
-                # Parse data into DataFrame
-                _candles[_darwin] = pd.DataFrame(
-                        data=[_row['candle'] for _row in _d['candles']],
-                        index=[_row['timestamp'] for _row in _d['candles']])
-                
-                # Convert timestamp EPOCHs to human-readable datetimes
-                _candles[_darwin].index = pd.to_datetime(_candles[_darwin].index, unit='s')
+            if _darwin in _failed:
+                print('[WARNING] Candles for ${} incomplete, skipping'.format(_darwin))
+                continue
                 
-            except Exception as ex:
-                _exstr = "Exception Type {0}. Args:\n{1!r}"
-                _msg = _exstr.format(type(ex).__name__, ex.args)
-                print(_msg)
-                return None
+            _candles[_darwin] = self._Merge_Candles_(_chunks[_darwin])
         
         return _candles
     
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+    AsyncDWX_AccInfo_API.py - Investor AccountInfo API (asyncio variant of DWX_AccInfo_API)
+    --
+    @author: Darwinex Labs (www.darwinex.com)
+
+    Last Updated: October 18, 2026
+
+    Copyright (c) 2017-2019, Darwinex. All rights reserved.
+
+    Licensed under the BSD 3-Clause License, you may not use this file except
+    in compliance with the License.
+
+    You may obtain a copy of the License at:
+    https://opensource.org/licenses/BSD-3-Clause
+"""
+import os
+os.chdir('<INSERT-PATH-TO-PROJECT-DIR-HERE>')
+
+from API.dwx_api_async import AsyncDWX_API, _awaitable_
+from API.InvestorAccountInfoAPI.DWX_AccInfo_API import DWX_AccInfo_API
+
+"""
+Every endpoint method below is a coroutine with the same arguments and return
+value as in DWX_AccInfo_API, e.g.
+
+    async def main():
+        async with AsyncDWX_AccInfo_API(_demo=True) as _api:
+            return await asyncio.gather(
+                    _api._Get_Account_Info_(_id=1), _api._Get_Account_Info_(_id=2))
+"""
+
+class AsyncDWX_AccInfo_API(AsyncDWX_API, DWX_AccInfo_API):
+
+    def __init__(self, _max_concurrency=16, **kwargs):
+        super(AsyncDWX_AccInfo_API, self).__init__(_max_concurrency=_max_concurrency,
+                                                   **kwargs)
+
+    #########################################################################
+
+    _Get_Accounts_                     = _awaitable_(DWX_AccInfo_API._Get_Accounts_)
+    _Get_Account_Info_                 = _awaitable_(DWX_AccInfo_API._Get_Account_Info_)
+    _Get_Trade_by_ID_                  = _awaitable_(DWX_AccInfo_API._Get_Trade_by_ID_)
+    _Get_Order_by_ID_                  = _awaitable_(DWX_AccInfo_API._Get_Order_by_ID_)
+    _Get_Conditional_Order_by_ID_      = _awaitable_(DWX_AccInfo_API._Get_Conditional_Order_by_ID_)
+    _Get_Conditional_Orders_by_Status_ = _awaitable_(DWX_AccInfo_API._Get_Conditional_Orders_by_Status_)
+    _Get_Current_Open_Positions_       = _awaitable_(DWX_AccInfo_API._Get_Current_Open_Positions_)
+    _Get_Executed_Orders_              = _awaitable_(DWX_AccInfo_API._Get_Executed_Orders_)
+    _Get_Trades_by_Status_             = _awaitable_(DWX_AccInfo_API._Get_Trades_by_Status_)
+
+    #########################################################################
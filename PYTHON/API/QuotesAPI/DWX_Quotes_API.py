@@ -14,16 +14,16 @@
     You may obtain a copy of the License at:    
     https://opensource.org/licenses/BSD-3-Clause
 """
-import os
+import os, threading
 os.chdir('<INSERT-PROJECT-ROOT-DIR-HERE>')
 
 from MINIONS.dwx_graphics_helpers import DWX_Graphics_Helpers
+from MINIONS.dwx_quote_decoder import DWX_Quote_Decoder
+from MINIONS.dwx_tick_buffer import DWX_Tick_Store
 from API.dwx_api import DWX_API
 
 from matplotlib import pyplot as plt
-from requests import Session
 import pandas as pd
-import numpy as np
 
 pd.set_option('display.width', 1000)
 pd.set_option('display.max_columns', 500)
@@ -47,9 +47,6 @@ class DWX_Quotes_API(DWX_API):
                         _endpoint='/quotes',
                         _symbols=['THA.4.12','LVS.4.20']):
         
-        # Create session for streaming quotes
-        _s = Session()
-        
         # Construct DARWIN list for sending to the endpoint
         _data = "{\"productNames\": [ \"" + "\",\"".join(_symbols) + "\" ]}"
         
@@ -60,8 +57,8 @@ class DWX_Quotes_API(DWX_API):
                                _json=False,
                                _stream=True)
                 
-        # Send the request
-        _resp = _s.send(_ret.prepare(), stream=True, verify=True)
+        # Send the request over the shared, pooled session
+        _resp = self._session.send(_ret.prepare(), stream=True, verify=True)
         
         # Yield output
         for _l in _resp.iter_lines():
@@ -72,64 +69,117 @@ class DWX_Quotes_API(DWX_API):
     
     def _process_stream_(self, 
                          _symbols=['DWZ.4.7','DWC.4.20','LVS.4.20','SYO.4.24','YZZ.4.20'],
-                         _plot=True):
+                         _plot=True,
+                         _decoder=None,  # Defaults to DWX_Quote_Decoder()
+                         _capacity=10000, # Ticks kept per DARWIN
+                         _fps=5,         # Chart refreshes per second if _plot
+                         _verbose=False, # Print every tick
+                         _handlers=[]):  # Callables f(darwin, quote, timestamp)
+        
+        if _decoder is None:
+            _decoder = DWX_Quote_Decoder()
        
-        # Create empty dataframe
-        self._df = pd.DataFrame(columns=_symbols)
+        # Fixed-size tick store, see _Get_Ticks_DataFrame_() for a wide view
+        self._ticks = DWX_Tick_Store(_symbols=_symbols, _capacity=_capacity)
         
-        # Create graphing objects if _plot==True
-        if _plot:
+        # DARWINs with ticks not yet drawn, guarded by _ticks_lock
+        self._dirty = set()
+        self._ticks_lock = threading.Lock()
+        self._stop_event = threading.Event()
             
-            # Create fig, ax
-            if len(_symbols) > 1:
-                _fig, _ax = plt.subplots(nrows=1, ncols=len(_symbols), figsize=(20,4))
-            else:
-                _fig, _ax = plt.subplots(figsize=(10,6))        
+        # Headless: ingest in the calling thread, nothing else to do
+        if not _plot:
+            self._ingest_stream_(_symbols, _decoder, _verbose, _handlers)
+            return
+        
+        # Otherwise ingest on a background thread and keep matplotlib, which
+        # is not thread-safe, in this one. Ticks are never held up by drawing.
+        _ingest = threading.Thread(target=self._ingest_stream_,
+                                   args=(_symbols, _decoder, _verbose, _handlers),
+                                   daemon=True)
+        _ingest.start()
+        
+        # Create fig, ax
+        if len(_symbols) > 1:
+            _fig, _ax = plt.subplots(nrows=1, ncols=len(_symbols), figsize=(20,4))
+        else:
+            _fig, _ax = plt.subplots(figsize=(10,6))        
+        
+        try:
+            while _ingest.is_alive():
+                
+                # Coalesce: every DARWIN that ticked since the last frame is
+                # redrawn once, from a copy of its last 100 ticks
+                with self._ticks_lock:
+                    _frames = {_darwin: self._ticks._to_frame_(_darwin, 100) 
+                               for _darwin in self._dirty}
+                    self._dirty = set()
+                
+                for _darwin, _df in _frames.items():
+                    
+                    # Axis to pass
+                    if len(_symbols) > 1:
+                        _axp = _ax[_symbols.index(_darwin)]
+                    else:
+                        _axp = _ax
+                    
+                    # Call plotter function from self._graphics
+                    self._graphics._mpl_plot_axis_(
+                            plt, 
+                            _axp,
+                            _df,
+                            _darwin,
+                            'Last 100 ticks',
+                            'Quote',
+                            '#00fa9a',
+                            0.5,
+                            100,
+                            '#07335B',
+                            {'fontname':'Courier New'},
+                            _draw=False)
+                
+                if len(_frames) > 0:
+                    plt.tight_layout()
+                
+                # Draw and wait out the rest of the frame
+                plt.pause(1.0 / _fps)
+        
+        except KeyboardInterrupt:
+            self._stop_stream_()
+    
+    ##########################################################################
+    
+    def _ingest_stream_(self, _symbols, _decoder, _verbose=False, _handlers=[]):
             
         # for line in self.streaming(symbols=_symbols):
         for _ret in self._stream_quotes_(_symbols=_symbols):
+            
+            if self._stop_event.is_set():
+                break
         
-            # Parse string to dict
-            _stream = eval(_ret)
-        
-            # Extract values of interest.
-            _darwin = _stream['productName']
-            _quote = _stream['quote']
-            _timestamp = _stream['timestamp']
+            # Extract values of interest straight from the raw bytes
+            _darwin, _quote, _timestamp = _decoder._decode_(_ret)
             
-            # Add to DataFrame
-            _quotes = [np.nan for x in range(self._df.shape[1])]
-            _quotes[_symbols.index(_darwin)] = _quote
-            _row = pd.Series(index=_symbols,
-                             data=_quotes,
-                             name=_timestamp)
+            # Add to tick store, O(1)
+            with self._ticks_lock:
+                self._ticks._append_(_darwin, _timestamp, _quote)
+                self._dirty.add(_darwin)
             
-            self._df = self._df.append(_row)
-            self._df.fillna(method='ffill', inplace=True)
-            self._df.fillna(method='bfill', inplace=True)
+            for _handler in _handlers:
+                _handler(_darwin, _quote, _timestamp)
             
-            if _plot == False:
-                print(_stream)
-            else:
-                # Axis to pass
-                if len(_symbols) > 1:
-                    _axp = _ax[_symbols.index(_darwin)]
-                else:
-                    _axp = _ax
+            if _verbose:
+                print(_ret.decode())
                     
-                # Call plotter function from self._graphics
-                self._graphics._mpl_plot_axis_(
-                        plt, 
-                        _axp,
-                        #_ax[_symbols.index(_darwin)], 
-                        self._df,
-                        _darwin,
-                        'Last 100 ticks',
-                        'Quote',
-                        '#00fa9a',
-                        0.5,
-                        100,
-                        '#07335B',
-                        {'fontname':'Courier New'})
+    def _stop_stream_(self):
+        self._stop_event.set()
               
     ##########################################################################
+    
+    def _Get_Ticks_DataFrame_(self, _n=None):
+        
+        # Wide, forward-filled DataFrame of the last _n ticks per DARWIN
+        with self._ticks_lock:
+            return self._ticks._to_wide_frame_(_n)
+    
+    ##########################################################################
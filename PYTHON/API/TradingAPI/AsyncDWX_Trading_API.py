@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+    AsyncDWX_Trading_API.py - DARWIN Trading API (asyncio variant of DWX_Trading_API)
+    --
+    @author: Darwinex Labs (www.darwinex.com)
+
+    Last Updated: October 18, 2026
+
+    Copyright (c) 2017-2019, Darwinex. All rights reserved.
+
+    Licensed under the BSD 3-Clause License, you may not use this file except
+    in compliance with the License.
+
+    You may obtain a copy of the License at:
+    https://opensource.org/licenses/BSD-3-Clause
+"""
+import os
+os.chdir('<INSERT-PATH-TO-PROJECT-DIR-HERE>')
+
+from API.dwx_api_async import AsyncDWX_API, _awaitable_
+from API.TradingAPI.DWX_Trading_API import DWX_Trading_API
+
+"""
+Every endpoint method below is a coroutine with the same arguments and return
+value as in DWX_Trading_API, e.g.
+
+    async def main():
+        async with AsyncDWX_Trading_API(_demo=True) as _api:
+            return await asyncio.gather(
+                    _api._Get_Permitted_Operations_(), _api._Get_Account_Leverage_(_id=1))
+"""
+
+class AsyncDWX_Trading_API(AsyncDWX_API, DWX_Trading_API):
+
+    def __init__(self, _max_concurrency=16, **kwargs):
+        super(AsyncDWX_Trading_API, self).__init__(_max_concurrency=_max_concurrency,
+                                                   **kwargs)
+
+    #########################################################################
+
+    _Get_Permitted_Operations_ = _awaitable_(DWX_Trading_API._Get_Permitted_Operations_)
+    _Get_Account_Leverage_     = _awaitable_(DWX_Trading_API._Get_Account_Leverage_)
+    _Raise_Conditional_Order_  = _awaitable_(DWX_Trading_API._Raise_Conditional_Order_)
+    _Update_Conditional_Order_ = _awaitable_(DWX_Trading_API._Update_Conditional_Order_)
+    _Cancel_Conditional_Order_ = _awaitable_(DWX_Trading_API._Cancel_Conditional_Order_)
+    _Buy_At_Market_            = _awaitable_(DWX_Trading_API._Buy_At_Market_)
+    _Sell_At_Market            = _awaitable_(DWX_Trading_API._Sell_At_Market)
+    _Close_All_Account_Trades_ = _awaitable_(DWX_Trading_API._Close_All_Account_Trades_)
+    _Close_All_DARWIN_Trades_  = _awaitable_(DWX_Trading_API._Close_All_DARWIN_Trades_)
+
+    #########################################################################
@@ -19,14 +19,53 @@ import os
 os.chdir('<INSERT-ROOT-PROJECT-DIRECTORY-HERE>')
 
 from API.dwx_api import DWX_API
-import websockets, json, asyncio
+from MINIONS.dwx_quote_decoder import DWX_Quote_Decoder
+from MINIONS.dwx_quote_queue import DWX_Quote_Queue
+import websockets, json, asyncio, random, inspect
+
+# Written against the websockets >= 14 client (connect(additional_headers=..))
+if int(websockets.__version__.split('.')[0]) < 14:
+    raise ImportError('DWX_WebSocket_API requires websockets >= 14, found {}'
+                      .format(websockets.__version__))
+
+"""
+Requires websockets >= 14.
+
+Example Usage:
+    
+    _ws = DWX_WebSocket_API()
+    
+    async def on_quote(_darwin, _quote, _timestamp):
+        print(_darwin, _quote, _timestamp)
+    
+    _ws.add_handler(on_quote)
+    _ws.run(['DWZ.4.7','LVS.4.20'])
+    
+    # For thousands of DARWINs with slow handlers, keep only the latest quote
+    # per DARWIN instead of letting the socket back up:
+    _ws = DWX_WebSocket_API(_overflow='conflate')
+    _ws.queue_stats()   # {'received': .., 'dropped': .., 'conflated': .., ..}
+    
+    # Meanwhile, from a coroutine on the same loop:
+    await _ws.add_symbols(['SYO.4.24'])
+    await _ws.remove_symbols(['DWZ.4.7'])
+"""
 
 class DWX_WebSocket_API(DWX_API):
     
+    # Keys every streamed quote carries
+    _quote_keys = {'productName', 'quote', 'timestamp'}
+    
     def __init__(self,
                  _api_url='ws://api.darwinex.com/quotewebsocket/1.0.0',
                  _api_name='',
-                 _version=0.0):
+                 _version=0.0,
+                 _backoff_base=0.5,  # Seconds, doubled per failed attempt..
+                 _backoff_max=30.0,  # ..up to this cap, with full jitter
+                 _decoder=None,      # Defaults to DWX_Quote_Decoder()
+                 _queue_size=10000,  # Quotes buffered between socket and handlers
+                 _overflow='block',  # 'block', 'drop_oldest' or 'conflate'
+                 _consumers=1):      # Tasks running handlers, each owns a share of DARWINs
         
         super(DWX_WebSocket_API, self).__init__(_api_url, _api_name, _version)
         
@@ -37,24 +76,197 @@ class DWX_WebSocket_API(DWX_API):
         self._active = True
         self._websocket = None
         
+        # Loop running subscribe(), used by stop() from other threads
+        self.event_loop = None
+        
+        # Current subscriptions, replayed after every reconnect
+        self._symbols = []
+        
+        # Callables f(darwin, quote, timestamp), plain functions or coroutines
+        self._handlers = []
+        
+        self._decoder = _decoder if _decoder is not None else DWX_Quote_Decoder()
+        self._backoff_base = _backoff_base
+        self._backoff_max = _backoff_max
+        
+        # Receive -> queue -> handlers pipeline, created in subscribe()
+        self._queue_size = _queue_size
+        self._overflow = _overflow
+        self._consumers = _consumers
+        self._queues = []
+        
+    ##########################################################################
+    
+    def add_handler(self, _handler):
+        if _handler not in self._handlers:
+            self._handlers.append(_handler)
+    
+    def remove_handler(self, _handler):
+        if _handler in self._handlers:
+            self._handlers.remove(_handler)
+    
+    ##########################################################################
+    
+    async def add_symbols(self, _symbols):
+        
+        _new = [_s for _s in _symbols if _s not in self._symbols]
+        self._symbols.extend(_new)
+        
+        if len(_new) > 0:
+            await self._send_op_('subscribe', _new)
+    
+    async def remove_symbols(self, _symbols):
+        
+        _old = [_s for _s in _symbols if _s in self._symbols]
+        self._symbols = [_s for _s in self._symbols if _s not in _old]
+        
+        if len(_old) > 0:
+            await self._send_op_('unsubscribe', _old)
+    
+    async def _send_op_(self, _op, _symbols):
+        
+        # If disconnected, the change is applied on reconnect instead
+        if self._websocket is None:
+            return
+        
+        try:
+            await self._websocket.send(json.dumps({ 'op': _op, 'productNames' :_symbols}))
+            
+        except websockets.ConnectionClosed:
+            pass
+    
     ##########################################################################
     
     async def subscribe(self, _symbols=['DWZ.4.7','DWC.4.20','LVS.4.20','SYO.4.24','YZZ.4.20']):
         
-        async with websockets.connect(self._url, 
-                                      extra_headers=self._auth_headers) as websocket:
-
-           # Subscribe to symbols
-           await websocket.send(json.dumps({ 'op': 'subscribe', 'productNames' :_symbols}))
-           
-           # If _active is True, process data received.
-           while self._active:
-               
-               _ret = await websocket.recv()
-               
-               # Insert your Quote handling logic here
-               print(_ret)
-
+        self._symbols.extend([_s for _s in _symbols if _s not in self._symbols])
+        self._active = True
+        self.event_loop = asyncio.get_running_loop()
+        
+        # Socket reads only ever enqueue; handlers run in consumer tasks, so
+        # a slow handler cannot stall recv(). One queue per consumer, with
+        # each DARWIN always routed to the same one, keeps its quotes in order.
+        self._queues = [DWX_Quote_Queue(max(1, self._queue_size // self._consumers), self._overflow)
+                        for _ in range(self._consumers)]
+        _tasks = [asyncio.ensure_future(self._consume_(_queue)) for _queue in self._queues]
+        
+        try:
+            await self._receive_()
+            
+        finally:
+            for _task in _tasks:
+                _task.cancel()
+    
+    ##########################################################################
+    
+    async def _receive_(self):
+        
+        _attempt = 0
+        
+        while self._active:
+            
+            try:
+                # Headers re-read on every connect, so refreshed tokens apply
+                async with websockets.connect(self._url, 
+                                              additional_headers=self._auth_headers) as websocket:
+                    
+                    self._websocket = websocket
+                    
+                    # Subscribe (or re-subscribe) to symbols
+                    if len(self._symbols) > 0:
+                        await websocket.send(json.dumps({ 'op': 'subscribe', 'productNames' :self._symbols}))
+                    
+                    # If _active is True, process data received.
+                    while self._active:
+                        
+                        _ret = await websocket.recv()
+                        
+                        # Only a delivering connection resets the backoff
+                        _attempt = 0
+                        
+                        await self._enqueue_(_ret)
+                        
+            except (websockets.ConnectionClosed, websockets.InvalidHandshake, 
+                    OSError, asyncio.TimeoutError) as ex:
+                
+                if not self._active:
+                    break
+                
+                # Full jitter: uniform in [0, min(cap, base * 2^attempt)]
+                _delay = random.uniform(0, min(self._backoff_max, 
+                                               self._backoff_base * 2 ** _attempt))
+                _attempt += 1
+                
+                print('[WebSocketAPI] Connection lost ({}: {}), reconnecting in {:.1f}s..'
+                      .format(type(ex).__name__, ex, _delay))
+                
+                await asyncio.sleep(_delay)
+                
+            finally:
+                self._websocket = None
+    
+    ##########################################################################
+    
+    async def _enqueue_(self, _ret):
+        
+        try:
+            _msg = self._decoder._parse_(_ret)
+            
+        except (ValueError, SyntaxError, TypeError):
+            print('[WebSocketAPI] Could not decode message: {}'.format(_ret))
+            return
+        
+        # One quote or a list of quotes per message
+        for _quote in (_msg if isinstance(_msg, list) else [_msg]):
+            
+            # Heartbeats, acks and error frames are not quotes, skip them
+            if not isinstance(_quote, dict) or not self._quote_keys <= _quote.keys():
+                
+                if isinstance(_quote, dict) and 'error' in _quote:
+                    print('[WebSocketAPI] Server error: {}'.format(_quote))
+                
+                continue
+            
+            _queue = self._queues[hash(_quote['productName']) % len(self._queues)]
+            
+            await _queue._put_((_quote['productName'], 
+                                _quote['quote'], 
+                                _quote['timestamp']))
+    
+    ##########################################################################
+    
+    async def _consume_(self, _queue):
+        
+        while True:
+            
+            _darwin, _quote, _timestamp = await _queue._get_()
+            
+            for _handler in list(self._handlers):
+                
+                try:
+                    _r = _handler(_darwin, _quote, _timestamp)
+                    
+                    if inspect.isawaitable(_r):
+                        await _r
+                        
+                except Exception as ex:
+                    # A failing handler must not stop the pipeline
+                    print('[WebSocketAPI] Handler error: {0}, Args: {1!r}'.format(type(ex).__name__, ex.args))
+    
+    ##########################################################################
+    
+    def queue_stats(self):
+        
+        # Received / delivered / dropped / conflated / queued quote counts,
+        # summed over the consumers' queues
+        _stats = {}
+        
+        for _queue in self._queues:
+            for _key, _value in _queue._stats_().items():
+                _stats[_key] = _stats.get(_key, 0) + _value
+        
+        return _stats
+    
     ##########################################################################
 		
     def run(self, _symbols=['DWZ.4.7','DWC.4.20','LVS.4.20','SYO.4.24','YZZ.4.20']):
@@ -71,8 +283,13 @@ class DWX_WebSocket_API(DWX_API):
     
     def stop(self):
         """
-        Stop and close loop
+        Stop subscribing and close the connection, which lets subscribe()
+        and run() return. Safe to call from any thread.
         """
-        self.event_loop.stop()
+        self._active = False
+        
+        # Nothing to close before subscribe() has connected
+        if self._websocket is not None and self.event_loop is not None:
+            asyncio.run_coroutine_threadsafe(self._websocket.close(), self.event_loop)
         
     ##########################################################################
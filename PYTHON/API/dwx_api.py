@@ -14,19 +14,62 @@
     You may obtain a copy of the License at:    
     https://opensource.org/licenses/BSD-3-Clause
 """
-import os, requests
+import os, json, requests
+from requests.adapters import HTTPAdapter
 os.chdir('<INSERT-PATH-TO-PROJECT-DIR-HERE>')
 
 from AUTH.dwx_oauth2_p3 import DWX_OAuth2
 from MINIONS.dwx_file_io import load_config
+from MINIONS.dwx_rate_limiter import DWX_Rate_Limiter
+from MINIONS.dwx_response_cache import DWX_Response_Cache
 
 class DWX_API(object):
     
+    # Connection pool shared by every DWX_API (sub)class instance, keyed by
+    # (pool_connections, pool_maxsize, pool_block). Re-using one Session 
+    # keeps TCP+TLS connections to api.darwinex.com alive between calls.
+    _sessions = {}
+    
+    # Initial requests / second of an instance's token bucket, unless given
+    # _rate or _rate_limiter. Subclasses may override it, e.g. 
+    # DWX_Info_API._default_rate = 25. Instances using the same rate share
+    # one (adaptive) bucket, keyed by rate.
+    _default_rate = 10.0
+    _limiters = {}
+    
+    # DWX_OAuth2 objects shared by instances using the same credentials file
+    _auths = {}
+    
+    # In-memory GET response cache shared by every DWX_API (sub)class 
+    # instance, unless an instance is given its own via _response_cache.
+    _shared_response_cache = DWX_Response_Cache()
+    
     def __init__(self, 
                  _api_url='https://api.darwinex.com',
                  _api_name='darwininfo',
                  _version=1.5,
-                 _demo=False):
+                 _demo=False,
+                 _pool_connections=10, # Number of hosts to keep pools for
+                 _pool_maxsize=20,     # Max. keep-alive connections per host
+                 _pool_block=False,    # If True, wait for a free connection
+                 _rate_limiter=None,   # DWX_Rate_Limiter, default is shared by _rate
+                 _rate=None,           # Initial requests / second, default _default_rate
+                 _max_retries=3,       # Retries on 429/503 responses
+                 _response_cache=None):# DWX_Response_Cache, default is shared
+        
+        # Shared, pooled HTTP session for all requests
+        self._session = self._Get_Session_(_pool_connections,
+                                           _pool_maxsize,
+                                           _pool_block)
+        
+        # Request pacing, adapts to 429 / Retry-After responses
+        self._limiter = _rate_limiter if _rate_limiter is not None \
+                                      else self._Get_Limiter_(_rate or self._default_rate)
+        self._max_retries = _max_retries
+        
+        # GET responses of endpoints with a TTL rule, see DWX_Response_Cache
+        self._response_cache = _response_cache if _response_cache is not None \
+                                               else self._shared_response_cache
         
         # OAuth2 object for access/refresh token retrieval
         if _demo:
@@ -34,22 +77,100 @@ class DWX_API(object):
         else:
             _creds_filename = 'CONFIG/creds.cfg'
             
-        self._auth = DWX_OAuth2(load_config(_creds_filename))
+        self._auth = self._Get_Auth_(_creds_filename)
         
         # Construct main production url for tagging endpoints
         self._url = '{}/{}/{}'.format(_api_url, _api_name, _version)
         
-        # Construct authorization header for all requests
-        self._auth_headers = {'Authorization': 'Bearer {}'.format(self._auth._data['access_token'])}
+        # Construct authorization headers for all requests
+        self._post_headers = {}
+        self._Set_Auth_Headers_(self._auth._data['access_token'])
+        
+        # Swap in new headers whenever the shared token is refreshed
+        self._auth._register_(self._Set_Auth_Headers_)
+        
+    ##########################################################################
+    
+    @classmethod
+    def _Get_Auth_(cls, _creds_filename):
+        
+        # One DWX_OAuth2 (and background refresher) per credentials file,
+        # with tokens cached alongside it, e.g. CONFIG/creds.tokens.json
+        if _creds_filename not in cls._auths:
+            cls._auths[_creds_filename] = DWX_OAuth2(load_config(_creds_filename),
+                                                     _token_file=os.path.splitext(_creds_filename)[0] 
+                                                                 + '.tokens.json')
+        
+        return cls._auths[_creds_filename]
+    
+    ##########################################################################
+    
+    def _Set_Auth_Headers_(self, _access_token):
+        
+        # Build complete dicts first, then rebind, so that requests in other
+        # threads never see a partially updated header dict.
+        _auth_headers = {'Authorization': 'Bearer {}'.format(_access_token)}
         
         # Construct headers for POST requests
-        self._post_headers = {**self._auth_headers,
-                              **{'Content-type':'application/json',
-                                 'Accept':'application/json'}}
+        _post_headers = {**self._post_headers,
+                         **_auth_headers,
+                         **{'Content-type':'application/json',
+                            'Accept':'application/json'}}
         
+        self._auth_headers, self._post_headers = _auth_headers, _post_headers
+        
+    ##########################################################################
+    
+    @classmethod
+    def _Get_Session_(cls, _pool_connections=10, _pool_maxsize=20, _pool_block=False):
+        
+        _key = (_pool_connections, _pool_maxsize, _pool_block)
+        
+        if _key not in cls._sessions:
+            
+            _adapter = HTTPAdapter(pool_connections=_pool_connections,
+                                   pool_maxsize=_pool_maxsize,
+                                   pool_block=_pool_block)
+            
+            _session = requests.Session()
+            _session.mount('https://', _adapter)
+            _session.mount('http://', _adapter)
+            _session.headers['Connection'] = 'keep-alive'
+            
+            # Dict lives on DWX_API, so all subclasses share the same pool
+            cls._sessions[_key] = _session
+            
+        return cls._sessions[_key]
+    
+    ##########################################################################
+    
+    @classmethod
+    def _Get_Limiter_(cls, _rate=10.0):
+        
+        if _rate not in cls._limiters:
+            
+            # Allow a one second burst, and recovery above the initial rate
+            cls._limiters[_rate] = DWX_Rate_Limiter(_rate=_rate,
+                                                    _burst=max(1, _rate),
+                                                    _max_rate=max(100.0, _rate))
+        
+        return cls._limiters[_rate]
+    
     ##########################################################################
     """
     Call any endpoint provided in the Darwinex API documentation, and get JSON.
+    
+    Every request first takes a token from self._limiter, which starts at
+    _rate (default _default_rate = 10) requests / second, e.g.
+    DWX_Info_API(_rate=25) for parallel downloads. Throttled responses 
+    (429/503) halve the rate of every client sharing that limiter; successes
+    raise it again gradually. GET requests are retried up to _max_retries 
+    times, while POST / PUT / DELETE (e.g. orders) are only retried on a 429
+    with Retry-After, see _Retryable_().
+    A 401 response triggers one access token refresh and retry.
+    
+    JSON GET responses are served from self._response_cache while fresh, and
+    revalidated with If-None-Match / If-Modified-Since once stale.
     """
     def _Call_API_(self, _endpoint, _type, _data, _json=True, _stream=False):
         
@@ -58,42 +179,79 @@ class DWX_API(object):
             print('Bad request type')
             return None
         
+        if _type == 'POST' and len(_data) == 0:
+            print('Data is empty..')
+            return None
+        
         try:
             
-            if _type == 'GET':
-                _ret = requests.get(self._url + _endpoint,
-                                    headers=self._auth_headers,
-                                    verify=True)
-            elif _type == 'PUT':
-                _ret = requests.put(self._url + _endpoint,
-                                    headers=self._post_headers,
-                                    data=_data,
-                                    verify=True)
-            elif _type == 'DELETE':
-                _ret = requests.delete(self._url + _endpoint,
-                                       headers=self._auth_headers,
-                                       #data=_data,
-                                       verify=True)
-            else:
-                if len(_data) == 0:
-                    print('Data is empty..')
-                    return None
+            # For DARWIN Quotes API
+            if _type == 'POST' and _stream:
+                
+                self._limiter._acquire_()
+                
+                # Add POST header for streaming quotes        
+                self._post_headers['connection'] = 'keep-alive'
+                return requests.Request('POST',
+                                       self._url + _endpoint,
+                                       headers=self._post_headers,
+                                       data=_data)
+            
+            # Seconds a response stays fresh, 0 if not cacheable
+            _ttl = self._response_cache._ttl_(_endpoint) if _type == 'GET' and _json else 0
+            _validators = {}
+            
+            if _ttl > 0:
+                
+                _body = self._response_cache._fresh_(self._url + _endpoint)
+                
+                if _body is not None:
+                    return json.loads(_body)
+                
+                _validators = self._response_cache._validators_(self._url + _endpoint)
+            
+            _refreshed = False
+            
+            for _attempt in range(self._max_retries + 1):
+                
+                self._limiter._acquire_()
+                
+                _token = self._auth_headers['Authorization']
+                _ret = self._Send_(_endpoint, _type, _data, _validators)
+                
+                self._limiter._update_(_ret.status_code, _ret.headers)
                 
-                # For DARWIN Quotes API
-                if _stream:
-                    
-                    # Add POST header for streaming quotes        
-                    self._post_headers['connection'] = 'keep-alive'
-                    return requests.Request('POST',
-                                           self._url + _endpoint,
-                                           headers=self._post_headers,
-                                           data=_data)
-                else:
-                    _ret = requests.post(self._url + _endpoint,
-                                         data=_data,
-                                         headers = self._post_headers,
-                                         verify=True)
+                # Expired / revoked token: refresh once and try again
+                if _ret.status_code == 401 and not _refreshed:
+                    _refreshed = True
+                    if self._auth._refresh_tokens_(_token.split(' ')[-1]):
+                        continue
+                
+                if not self._Retryable_(_type, _ret.status_code, _ret.headers) \
+                        or _attempt == self._max_retries:
+                    break
+                
+                print('[WARNING] HTTP {} on {}, backing off (retry {} / {})'
+                      .format(_ret.status_code, _endpoint, _attempt + 1, self._max_retries))
         
+            if _ttl > 0:
+                
+                # Not modified, keep the cached body for another _ttl seconds
+                if _ret.status_code == 304:
+                    _body = self._response_cache._revalidated_(self._url + _endpoint,
+                                                               _ret.headers, _ttl)
+                    if _body is not None:
+                        return json.loads(_body)
+                
+                    # Entry evicted since _validators_(), fetch the full body
+                    self._limiter._acquire_()
+                    _ret = self._Send_(_endpoint, _type, _data)
+                    self._limiter._update_(_ret.status_code, _ret.headers)
+                
+                if _ret.status_code == 200:
+                    self._response_cache._put_(self._url + _endpoint,
+                                               _ret.content, _ret.headers, _ttl)
+            
             if _json:
                 return _ret.json()
             else:
@@ -103,3 +261,38 @@ class DWX_API(object):
             print('Type: {0}, Args: {1!r}'.format(type(ex).__name__, ex.args))
             
     ##########################################################################
+    
+    def _Retryable_(self, _type, _status, _headers):
+        
+        if _status not in DWX_Rate_Limiter._throttle_codes:
+            return False
+        
+        # A POST / PUT / DELETE may have been executed despite a 503, so it
+        # is only resent when the server refused it outright (429 + Retry-After)
+        return _type == 'GET' or (_status == 429 and 'Retry-After' in _headers)
+    
+    ##########################################################################
+    
+    def _Send_(self, _endpoint, _type, _data, _headers={}):
+        
+        if _type == 'GET':
+            return self._session.get(self._url + _endpoint,
+                                     headers={**self._auth_headers, **_headers},
+                                     verify=True)
+        elif _type == 'PUT':
+            return self._session.put(self._url + _endpoint,
+                                     headers=self._post_headers,
+                                     data=_data,
+                                     verify=True)
+        elif _type == 'DELETE':
+            return self._session.delete(self._url + _endpoint,
+                                        headers=self._auth_headers,
+                                        #data=_data,
+                                        verify=True)
+        else:
+            return self._session.post(self._url + _endpoint,
+                                      data=_data,
+                                      headers = self._post_headers,
+                                      verify=True)
+            
+    ##########################################################################
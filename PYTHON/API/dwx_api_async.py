@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+    AsyncDWX_API - asyncio counterpart of DWX_API (Superclass for async sub-APIs)
+    --
+    @author: Darwinex Labs (www.darwinex.com)
+
+    Last Updated: October 18, 2026
+
+    Copyright (c) 2017-2019, Darwinex. All rights reserved.
+
+    Licensed under the BSD 3-Clause License, you may not use this file except
+    in compliance with the License.
+
+    You may obtain a copy of the License at:
+    https://opensource.org/licenses/BSD-3-Clause
+"""
+import os, json, asyncio, functools
+os.chdir('<INSERT-PATH-TO-PROJECT-DIR-HERE>')
+
+from API.dwx_api import DWX_API
+import aiohttp
+
+"""
+Example Usage:
+
+    async def main():
+        async with AsyncDWX_Info_API(_max_concurrency=32) as _info:
+            return await _info._Get_Historical_Quotes_(_symbols=['THA.4.12','LVS.4.20'])
+
+    _quotes = asyncio.run(main())
+"""
+
+class AsyncDWX_API(DWX_API):
+
+    def __init__(self, _max_concurrency=16, **kwargs):
+
+        # Authentication, URL and header construction as per DWX_API
+        super(AsyncDWX_API, self).__init__(**kwargs)
+
+        # Maximum number of requests in flight at any one time
+        self._max_concurrency = _max_concurrency
+
+        # Created lazily, inside the running event loop
+        self._async_session = None
+        self._semaphore = None
+
+    ##########################################################################
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self._Close_()
+
+    ##########################################################################
+
+    def _Get_Async_Session_(self):
+
+        if self._async_session is None or self._async_session.closed:
+
+            # Keep-alive connection pool sized to the concurrency limit
+            _connector = aiohttp.TCPConnector(limit=self._max_concurrency,
+                                              limit_per_host=self._max_concurrency)
+
+            self._async_session = aiohttp.ClientSession(connector=_connector)
+
+        return self._async_session
+
+    def _Get_Semaphore_(self):
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        return self._semaphore
+
+    async def _Close_(self):
+
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+
+        self._async_session = None
+        self._semaphore = None
+
+    ##########################################################################
+    """
+    Call any endpoint provided in the Darwinex API documentation, and get JSON.
+
+    Coroutine - at most _max_concurrency calls are in flight at any one time,
+    paced by the same token bucket (self._limiter) as the synchronous client,
+    and JSON GET responses share its response cache (self._response_cache).
+    """
+    async def _Call_API_(self, _endpoint, _type, _data, _json=True, _stream=False):
+
+        if _type not in ['GET','POST','PUT', 'DELETE']:
+            print('Bad request type')
+            return None
+
+        if _stream:
+            print('Streaming is not supported by AsyncDWX_API, please use DWX_Quotes_API')
+            return None
+
+        if _type == 'POST' and len(_data) == 0:
+            print('Data is empty..')
+            return None
+
+        if _type in ['GET', 'DELETE']:
+            _data = None
+
+        # Seconds a response stays fresh, 0 if not cacheable
+        _ttl = self._response_cache._ttl_(_endpoint) if _type == 'GET' and _json else 0
+        _validators = {}
+
+        if _ttl > 0:
+
+            _body = self._response_cache._fresh_(self._url + _endpoint)
+
+            if _body is not None:
+                return json.loads(_body)
+
+            _validators = self._response_cache._validators_(self._url + _endpoint)
+
+        try:
+
+            async with self._Get_Semaphore_():
+
+                _refreshed = False
+
+                for _attempt in range(self._max_retries + 1):
+
+                    # Shared with threads using the synchronous DWX_API
+                    await self._limiter._acquire_async_()
+
+                    # Re-read every attempt, headers are swapped on refresh
+                    _headers = self._auth_headers if _type in ['GET', 'DELETE'] else self._post_headers
+                    _headers = {**_headers, **_validators}
+                    _token = self._auth_headers['Authorization'].split(' ')[-1]
+
+                    async with self._Get_Async_Session_().request(_type,
+                                                                 self._url + _endpoint,
+                                                                 headers=_headers,
+                                                                 data=_data) as _ret:
+
+                        self._limiter._update_(_ret.status, _ret.headers)
+
+                        # Expired / revoked token: refresh once (off-loop) and retry
+                        if _ret.status == 401 and not _refreshed:
+                            _refreshed = True
+                            if await asyncio.get_event_loop().run_in_executor(
+                                    None, self._auth._refresh_tokens_, _token):
+                                continue
+
+                        if self._Retryable_(_type, _ret.status, _ret.headers) \
+                                and _attempt < self._max_retries:
+
+                            print('[WARNING] HTTP {} on {}, backing off (retry {} / {})'
+                                  .format(_ret.status, _endpoint, _attempt + 1, self._max_retries))
+                            continue
+
+                        if _ttl > 0:
+
+                            # Not modified, keep the cached body for another _ttl seconds
+                            if _ret.status == 304:
+                                _body = self._response_cache._revalidated_(self._url + _endpoint,
+                                                                           _ret.headers, _ttl)
+                                if _body is not None:
+                                    return json.loads(_body)
+
+                                # Entry evicted since _validators_(), fetch the full body
+                                await self._limiter._acquire_async_()
+
+                                async with self._Get_Async_Session_().request(_type,
+                                                                             self._url + _endpoint,
+                                                                             headers=self._auth_headers,
+                                                                             data=_data) as _full:
+
+                                    self._limiter._update_(_full.status, _full.headers)
+                                    _body = await _full.read()
+
+                                    if _full.status == 200:
+                                        self._response_cache._put_(self._url + _endpoint,
+                                                                   _body, _full.headers, _ttl)
+                                    return json.loads(_body)
+
+                            elif _ret.status == 200:
+                                _body = await _ret.read()
+                                self._response_cache._put_(self._url + _endpoint,
+                                                           _body, _ret.headers, _ttl)
+                                return json.loads(_body)
+
+                        if _json:
+                            return await _ret.json(content_type=None)
+                        else:
+                            # Read body before the connection is released
+                            await _ret.read()
+                            return _ret
+
+        except Exception as ex:
+            print('Type: {0}, Args: {1!r}'.format(type(ex).__name__, ex.args))
+
+    ##########################################################################
+
+"""
+Wrap a synchronous DWX sub-API method whose result is the return value of
+self._Call_API_(), so that it can be awaited when _Call_API_ is a coroutine.
+Methods that return early (e.g. on invalid input) still return their value.
+"""
+def _awaitable_(_method):
+
+    @functools.wraps(_method)
+    async def _wrapper_(self, *args, **kwargs):
+
+        _ret = _method(self, *args, **kwargs)
+
+        if asyncio.iscoroutine(_ret):
+            return await _ret
+
+        return _ret
+
+    return _wrapper_
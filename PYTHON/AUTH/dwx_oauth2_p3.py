@@ -4,7 +4,7 @@
     --
     @author: Darwinex Labs (www.darwinex.com)
     
-    Last Updated: May 16, 2019
+    Last Updated: October 18, 2026
     
     Copyright (c) 2017-2019, Darwinex. All rights reserved.
     
@@ -15,20 +15,58 @@
     https://opensource.org/licenses/BSD-3-Clause
 """
 
-import json, base64, requests
+import os, json, time, base64, weakref, threading, requests
 
 class DWX_OAuth2():
     
     def __init__(self, 
                  _creds_dict={},
-                 _token_url='https://api.darwinex.com/token'):
+                 _token_url='https://api.darwinex.com/token',
+                 _token_file=None,      # e.g. 'CONFIG/creds.tokens.json'
+                 _refresh_margin=120,   # Seconds before expiry to refresh
+                 _auto_refresh=True):   # Refresh in a background thread
         
-        # Get tokens from server
-        self._data = self._get_tokens_(_creds_dict['username'],
-                                       _creds_dict['password'],
-                                       _creds_dict['client_id'],
-                                       _creds_dict['client_secret'],
-                                       _token_url)
+        self._creds = _creds_dict
+        self._token_url = _token_url
+        self._token_file = _token_file
+        self._refresh_margin = _refresh_margin
+        
+        # Callbacks notified with the new access token after each refresh
+        self._listeners = []
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        
+        # Reuse a still-valid token from disk, else get tokens from server
+        self._data = self._load_tokens_()
+        
+        if self._data is None:
+            self._data = self._get_tokens_(_creds_dict['username'],
+                                           _creds_dict['password'],
+                                           _creds_dict['client_id'],
+                                           _creds_dict['client_secret'],
+                                           _token_url)
+            self._save_tokens_()
+        
+        if _auto_refresh:
+            self._refresher = threading.Thread(target=self._refresh_loop_, daemon=True)
+            self._refresher.start()
+    
+    ##########################################################################
+    
+    def _basic_auth_header_(self, client_id, client_secret):
+        
+        return {'Authorization': 'Basic {}'
+                    .format(base64.b64encode(bytes('{}:{}'
+                                                    .format(client_id,client_secret)
+                                                    .encode('utf-8'))).decode('utf-8'))}
+    
+    # Stamp absolute expiry so tokens can be judged after a restart
+    def _stamp_expiry_(self, _data):
+        
+        if _data is not None and 'expires_in' in _data:
+            _data['expires_at'] = time.time() + float(_data['expires_in'])
+        
+        return _data
     
     ##########################################################################
     
@@ -43,20 +81,169 @@ class DWX_OAuth2():
                 'password': password,
                 'scope': 'openid'}
     
-        headers = {'Authorization': 'Basic {}'
-                    .format(base64.b64encode(bytes('{}:{}'
-                                                    .format(client_id,client_secret)
-                                                    .encode('utf-8'))).decode('utf-8'))}
+        headers = self._basic_auth_header_(client_id, client_secret)
     
         try:
             _response = requests.post(token_url, headers=headers, data=data, verify=True, allow_redirects=False)
             
             print('\n\n--+--+--\n[KERNEL] Access & Refresh Tokens Retrieved Successfully\n--+--+--\n')
             
-            return json.loads(_response.text)
+            return self._stamp_expiry_(json.loads(_response.text))
+            
+        except Exception as ex:
+            print('Type: {0}, Args: {1!r}'.format(type(ex).__name__, ex.args))
+            return None
+    
+    ##########################################################################
+
+    # Function implements refresh token flow, falls back to password flow.
+    def _refresh_tokens_(self, _stale_token=None):
+        
+        with self._lock:
+            
+            # Another thread already refreshed the token the caller saw fail
+            if _stale_token is not None and self._data is not None \
+                    and self._data.get('access_token') != _stale_token:
+                return True
+            
+            _data = None
+            
+            if self._data is not None and 'refresh_token' in self._data:
+                
+                try:
+                    _response = requests.post(self._token_url,
+                                              headers=self._basic_auth_header_(self._creds['client_id'],
+                                                                               self._creds['client_secret']),
+                                              data={'grant_type': 'refresh_token',
+                                                    'refresh_token': self._data['refresh_token']},
+                                              verify=True, allow_redirects=False)
+                    
+                    if _response.status_code == 200:
+                        _data = self._stamp_expiry_(json.loads(_response.text))
+                
+                except Exception as ex:
+                    print('Type: {0}, Args: {1!r}'.format(type(ex).__name__, ex.args))
+            
+            if _data is None or 'access_token' not in _data:
+                _data = self._get_tokens_(self._creds['username'],
+                                          self._creds['password'],
+                                          self._creds['client_id'],
+                                          self._creds['client_secret'],
+                                          self._token_url)
+            
+            if _data is None or 'access_token' not in _data:
+                print('[ERROR] Could not refresh access token.')
+                return False
+            
+            # Servers may omit refresh_token when it is unchanged
+            if 'refresh_token' not in _data and self._data is not None \
+                    and 'refresh_token' in self._data:
+                _data['refresh_token'] = self._data['refresh_token']
+            
+            self._data = _data
+            self._save_tokens_()
+            
+            print('[KERNEL] Access Token Refreshed')
+        
+        self._notify_()
+        
+        return True
+    
+    ##########################################################################
+    
+    def _refresh_loop_(self):
+        
+        while not self._stop.is_set():
+            
+            _expires_at = (self._data or {}).get('expires_at')
+            
+            # Nothing to schedule against, check back later
+            if _expires_at is None:
+                _wait = 60
+            else:
+                _wait = max(0, _expires_at - self._refresh_margin - time.time())
             
+            if self._stop.wait(_wait):
+                break
+            
+            if _expires_at is not None and not self._refresh_tokens_():
+                
+                # Retry failed refreshes after a short pause
+                self._stop.wait(30)
+    
+    def _stop_refresh_(self):
+        self._stop.set()
+    
+    ##########################################################################
+    
+    def _register_(self, _callback):
+        
+        """Register a bound method to be called with each new access token.
+        Held by weak reference, so registered objects can still be collected."""
+        
+        with self._lock:
+            self._listeners.append(weakref.WeakMethod(_callback))
+    
+    def _notify_(self):
+        
+        with self._lock:
+            self._listeners = [_ref for _ref in self._listeners if _ref() is not None]
+            _callbacks = [_ref() for _ref in self._listeners]
+            _token = self._data['access_token']
+        
+        for _callback in _callbacks:
+            if _callback is not None:
+                _callback(_token)
+    
+    ##########################################################################
+    
+    def _load_tokens_(self):
+        
+        if self._token_file is None or not os.path.exists(self._token_file):
+            return None
+        
+        try:
+            with open(self._token_file, 'r') as _f:
+                _stored = json.load(_f)
+        
         except Exception as ex:
             print('Type: {0}, Args: {1!r}'.format(type(ex).__name__, ex.args))
             return None
+        
+        # Tokens must belong to these credentials and outlive the margin
+        if _stored.get('username') != self._creds.get('username') \
+                or _stored.get('client_id') != self._creds.get('client_id'):
+            return None
+        
+        _data = _stored.get('tokens', {})
+        
+        if 'access_token' not in _data \
+                or _data.get('expires_at', 0) - self._refresh_margin <= time.time():
+            return None
+        
+        print('\n\n--+--+--\n[KERNEL] Cached Access Token Loaded\n--+--+--\n')
+        
+        return _data
+    
+    def _save_tokens_(self):
+        
+        if self._token_file is None or self._data is None:
+            return
+        
+        try:
+            _tmp = self._token_file + '.tmp'
+            
+            # Owner read/write only
+            _fd = os.open(_tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            
+            with os.fdopen(_fd, 'w') as _f:
+                json.dump({'username': self._creds.get('username'),
+                           'client_id': self._creds.get('client_id'),
+                           'tokens': self._data}, _f)
+            
+            os.replace(_tmp, self._token_file)
+        
+        except Exception as ex:
+            print('Type: {0}, Args: {1!r}'.format(type(ex).__name__, ex.args))
     
     ##########################################################################
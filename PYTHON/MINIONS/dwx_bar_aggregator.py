@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+    DWX Bar Aggregator - Helper Class
+    --
+    @author: Darwinex Labs (www.darwinex.com)
+
+    Last Updated: October 18, 2026
+
+    Copyright (c) 2017-2019, Darwinex. All rights reserved.
+
+    Licensed under the BSD 3-Clause License, you may not use this file except
+    in compliance with the License.
+
+    You may obtain a copy of the License at:
+    https://opensource.org/licenses/BSD-3-Clause
+"""
+import re
+import numpy as np
+import pandas as pd
+
+"""
+Turns streamed ticks into OHLC bars for every DARWIN at once.
+
+Ticks of the current bar period are written into preallocated arrays
+(DARWIN id, quote). When a tick from a later period arrives, or _flush_() is
+called, all DARWINs' bars are computed in one vectorized pass and emitted
+as {darwin: DataFrame} - the same shape as _Get_DARWIN_OHLC_Candles_() -
+to every registered handler. With _as_frame=True a single DataFrame indexed
+by (timestamp, darwin) is emitted instead, which is cheaper for thousands of
+DARWINs at second resolution.
+
+Example Usage:
+
+    def on_bars(_bars):
+        print(_bars)
+
+    _agg = DWX_Bar_Aggregator(_resolution='5s', _handlers=[on_bars])
+
+    # DWX_Quotes_API
+    _quotes._process_stream_(_plot=False, _handlers=[_agg._on_tick_])
+
+    # DWX_WebSocket_API
+    _ws.add_handler(_agg._on_tick_)
+"""
+
+class DWX_Bar_Aggregator():
+
+    _units = {'s': 1000, 'm': 60 * 1000, 'h': 60 * 60 * 1000}
+
+    def __init__(self,
+                 _resolution='1m',   # e.g. 1s, 5s, 1m, 15m, 1h
+                 _capacity=65536,    # Ticks per bar period before growing
+                 _handlers=[],       # Callables f(bars)
+                 _as_frame=False):   # Emit one DataFrame, not {darwin: DataFrame}
+
+        _match = re.fullmatch(r'(\d+)([smh])', _resolution)
+
+        if _match is None:
+            raise ValueError('Resolution {} not recognized, use e.g. 1s, 5s, 1m'.format(_resolution))
+
+        self._bar_ms = int(_match.group(1)) * self._units[_match.group(2)]
+        self._handlers = list(_handlers)
+        self._as_frame = _as_frame
+
+        # DARWIN <-> integer id
+        self._ids = {}
+        self._names = []
+
+        # Ticks of the current bar period
+        self._sid = np.empty(_capacity, dtype=np.int32)
+        self._quote = np.empty(_capacity, dtype=np.float64)
+        self._n = 0
+        self._bar_start = None
+
+        # Ticks older than the current bar period, ignored
+        self._late = 0
+
+    ##########################################################################
+
+    def _on_tick_(self, _darwin, _quote, _timestamp):
+
+        _bar = int(_timestamp) - int(_timestamp) % self._bar_ms
+
+        if self._bar_start is None:
+            self._bar_start = _bar
+
+        elif _bar > self._bar_start:
+            self._flush_()
+            self._bar_start = _bar
+
+        elif _bar < self._bar_start:
+            self._late += 1
+            return
+
+        if _darwin not in self._ids:
+            self._ids[_darwin] = len(self._names)
+            self._names.append(_darwin)
+
+        # Grow (rarely) by doubling
+        if self._n == len(self._quote):
+            self._sid = np.concatenate([self._sid, np.empty_like(self._sid)])
+            self._quote = np.concatenate([self._quote, np.empty_like(self._quote)])
+
+        self._sid[self._n] = self._ids[_darwin]
+        self._quote[self._n] = _quote
+        self._n += 1
+
+    ##########################################################################
+
+    def _flush_(self):
+
+        """Close the current bar period, emit and return its bars."""
+
+        if self._n == 0:
+            return None
+
+        _sid = self._sid[:self._n]
+        _quote = self._quote[:self._n]
+
+        # Group ticks by DARWIN, keeping arrival order within each group
+        _order = np.argsort(_sid, kind='stable')
+        _sid, _quote = _sid[_order], _quote[_order]
+
+        _starts = np.flatnonzero(np.r_[True, _sid[1:] != _sid[:-1]])
+        _ends = np.r_[_starts[1:], len(_sid)] - 1
+
+        _open = _quote[_starts]
+        _high = np.maximum.reduceat(_quote, _starts)
+        _low = np.minimum.reduceat(_quote, _starts)
+        _close = _quote[_ends]
+
+        _ts = pd.to_datetime(self._bar_start, unit='ms')
+        _darwins = [self._names[_s] for _s in _sid[_starts]]
+
+        _bars = pd.DataFrame({'open': _open, 'high': _high,
+                              'low': _low, 'close': _close},
+                             index=pd.MultiIndex.from_product([[_ts], _darwins],
+                                                              names=['timestamp', 'darwin']))
+
+        # Per-DARWIN frames, as returned by _Get_DARWIN_OHLC_Candles_()
+        if not self._as_frame:
+            _bars = {_darwin: _bars.xs(_darwin, level='darwin') for _darwin in _darwins}
+
+        self._n = 0
+
+        for _handler in self._handlers:
+            _handler(_bars)
+
+        return _bars
+
+    ##########################################################################
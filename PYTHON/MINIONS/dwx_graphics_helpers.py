@@ -28,7 +28,7 @@ class DWX_Graphics_Helpers():
     def _mpl_plot_axis_(self, _plt, _ax, _df, _darwin, 
                           _x_title, _y_title, _line_color,
                           _line_width, _tail_max,
-                          _bgcolor, _tfont):
+                          _bgcolor, _tfont, _draw=True):
         
         # Matplotlib y-axis formatter
         @ticker.FuncFormatter
@@ -58,8 +58,10 @@ class DWX_Graphics_Helpers():
         
         _ax.grid(linestyle='-', linewidth='0.5', color='grey')
         
-        _plt.tight_layout() 
-        _plt.pause(0.01)
+        # Callers batching several axes per frame draw once themselves
+        if _draw:
+            _plt.tight_layout() 
+            _plt.pause(0.01)
         
     
     ##########################################################################
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+    DWX Quote Cache - Helper Class
+    --
+    @author: Darwinex Labs (www.darwinex.com)
+
+    Last Updated: October 18, 2026
+
+    Copyright (c) 2017-2019, Darwinex. All rights reserved.
+
+    Licensed under the BSD 3-Clause License, you may not use this file except
+    in compliance with the License.
+
+    You may obtain a copy of the License at:
+    https://opensource.org/licenses/BSD-3-Clause
+"""
+import os, glob
+import numpy as np
+
+"""
+On-disk store of DARWIN quote history, one pair of .npy files per DARWIN:
+
+    {_cache_dir}/{DARWIN}.timestamp.npy  -> int64, milliseconds since EPOCH
+    {_cache_dir}/{DARWIN}.quote.npy      -> float64
+
+Files are memory-mapped on load, so reading the last cached timestamp of a
+long history does not pull the whole file into memory.
+"""
+
+class DWX_Quote_Cache():
+
+    def __init__(self, _cache_dir='DATA/QUOTES'):
+
+        self._cache_dir = _cache_dir
+        os.makedirs(self._cache_dir, exist_ok=True)
+
+    ##########################################################################
+
+    def _paths_(self, _darwin):
+
+        return (os.path.join(self._cache_dir, f'{_darwin}.timestamp.npy'),
+                os.path.join(self._cache_dir, f'{_darwin}.quote.npy'))
+
+    ##########################################################################
+
+    def _load_(self, _darwin, _mmap=True):
+
+        _ts_path, _q_path = self._paths_(_darwin)
+
+        if not (os.path.exists(_ts_path) and os.path.exists(_q_path)):
+            return None, None
+
+        try:
+            _mode = 'r' if _mmap else None
+            _ts = np.load(_ts_path, mmap_mode=_mode)
+            _q = np.load(_q_path, mmap_mode=_mode)
+
+        except Exception as ex:
+            print('[ERROR] Quote cache for ${} unreadable: {}'.format(_darwin, ex))
+            return None, None
+
+        # Interrupted write, treat as not cached
+        if _ts.shape != _q.shape:
+            return None, None
+
+        return _ts, _q
+
+    ##########################################################################
+
+    def _last_timestamp_(self, _darwin):
+
+        _ts, _ = self._load_(_darwin)
+
+        if _ts is None or len(_ts) == 0:
+            return None
+
+        return int(_ts[-1])
+
+    ##########################################################################
+
+    def _append_(self, _darwin, _ts, _quotes):
+
+        """Append rows newer than the cached tail and return the merged arrays."""
+
+        _ts = np.asarray(_ts, dtype=np.int64)
+        _quotes = np.asarray(_quotes, dtype=np.float64)
+
+        _cached_ts, _cached_q = self._load_(_darwin)
+
+        if _cached_ts is not None and len(_cached_ts) > 0:
+
+            _mask = _ts > _cached_ts[-1]
+
+            # Nothing new, keep files untouched
+            if not _mask.any():
+                return np.array(_cached_ts), np.array(_cached_q)
+
+            _ts = np.concatenate([_cached_ts, _ts[_mask]])
+            _quotes = np.concatenate([_cached_q, _quotes[_mask]])
+
+        # Release memory maps before the files are replaced
+        del _cached_ts, _cached_q
+
+        for _path, _arr in zip(self._paths_(_darwin), (_ts, _quotes)):
+
+            # Write to temp file, then swap in
+            with open(_path + '.tmp', 'wb') as _f:
+                np.save(_f, _arr)
+
+            os.replace(_path + '.tmp', _path)
+
+        return _ts, _quotes
+
+    ##########################################################################
+
+    def _clear_(self, _darwin=None):
+
+        _pattern = '*.npy' if _darwin is None else f'{_darwin}.*.npy'
+
+        for _path in glob.glob(os.path.join(self._cache_dir, _pattern)):
+            os.remove(_path)
+
+    ##########################################################################
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+    DWX Quote Decoder - Helper Class
+    --
+    @author: Darwinex Labs (www.darwinex.com)
+
+    Last Updated: October 18, 2026
+
+    Copyright (c) 2017-2019, Darwinex. All rights reserved.
+
+    Licensed under the BSD 3-Clause License, you may not use this file except
+    in compliance with the License.
+
+    You may obtain a copy of the License at:
+    https://opensource.org/licenses/BSD-3-Clause
+"""
+import ast, json
+import numpy as np
+
+# orjson parses bytes directly and is several times faster than json
+try:
+    import orjson
+    _default_loads = orjson.loads
+except ImportError:
+    _default_loads = json.loads
+
+"""
+Decodes the {"productName": .., "quote": .., "timestamp": ..} records sent by
+the Quotes API straight from the raw bytes of each streamed line, with no
+intermediate str. Pass _loads to plug in any other parser.
+
+Example Usage:
+
+    _decoder = DWX_Quote_Decoder()
+
+    _darwin, _quote, _timestamp = _decoder._decode_(_line)
+
+    _darwins, _quotes, _timestamps = _decoder._decode_batch_(_lines)
+"""
+
+class DWX_Quote_Decoder():
+
+    def __init__(self, _loads=None):
+        self._loads = _loads if _loads is not None else _default_loads
+
+    ##########################################################################
+
+    def _parse_(self, _line):
+
+        try:
+            return self._loads(_line)
+
+        # Python-literal records (single quotes etc.), parsed safely
+        except ValueError:
+            if isinstance(_line, (bytes, bytearray, memoryview)):
+                _line = bytes(_line).decode('utf-8')
+            return ast.literal_eval(_line)
+
+    ##########################################################################
+
+    def _decode_(self, _line):
+
+        """Decode one record, returns (productName, quote, timestamp)."""
+
+        _d = self._parse_(_line)
+
+        return _d['productName'], _d['quote'], _d['timestamp']
+
+    ##########################################################################
+
+    def _decode_batch_(self, _lines):
+
+        """Decode many records in one parser call.
+
+        Returns a list of productNames, a float64 array of quotes and an
+        int64 array of timestamps.
+        """
+
+        if len(_lines) == 0:
+            return [], np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64)
+
+        try:
+            # One JSON array -> one call into the parser
+            _records = self._loads(b'[' + b','.join(_lines) + b']')
+
+        except ValueError:
+            _records = [self._parse_(_line) for _line in _lines]
+
+        return ([_d['productName'] for _d in _records],
+                np.fromiter((_d['quote'] for _d in _records),
+                            dtype=np.float64, count=len(_records)),
+                np.fromiter((_d['timestamp'] for _d in _records),
+                            dtype=np.int64, count=len(_records)))
+
+    ##########################################################################
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+    DWX Quote Queue - Helper Class
+    --
+    @author: Darwinex Labs (www.darwinex.com)
+
+    Last Updated: October 18, 2026
+
+    Copyright (c) 2017-2019, Darwinex. All rights reserved.
+
+    Licensed under the BSD 3-Clause License, you may not use this file except
+    in compliance with the License.
+
+    You may obtain a copy of the License at:
+    https://opensource.org/licenses/BSD-3-Clause
+"""
+import asyncio
+from collections import OrderedDict
+
+"""
+Bounded asyncio queue of (darwin, quote, timestamp) items that sits between
+a socket reader and slower consumers. What happens when it is full depends
+on _policy:
+
+    'block'       -> _put_() waits for space (backpressure on the reader)
+    'drop_oldest' -> the oldest queued quote is discarded
+    'conflate'    -> only the latest quote per DARWIN is kept; a DARWIN that
+                     already has a quote waiting is updated in place. Holds
+                     at most one quote per DARWIN, up to _maxsize DARWINs.
+
+_stats_() returns received / delivered / dropped / conflated counters.
+"""
+
+class DWX_Quote_Queue():
+
+    _policies = ('block', 'drop_oldest', 'conflate')
+
+    def __init__(self, _maxsize=10000, _policy='block'):
+
+        if _policy not in self._policies:
+            raise ValueError('_policy must be one of {}'.format(self._policies))
+
+        self._maxsize = _maxsize
+        self._policy = _policy
+
+        if _policy == 'conflate':
+            self._pending = OrderedDict()
+            self._ready = asyncio.Event()
+        else:
+            self._queue = asyncio.Queue(maxsize=_maxsize)
+
+        self._received = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._conflated = 0
+
+    ##########################################################################
+
+    def __len__(self):
+        return len(self._pending) if self._policy == 'conflate' else self._queue.qsize()
+
+    def _stats_(self):
+
+        return {'received': self._received,
+                'delivered': self._delivered,
+                'dropped': self._dropped,
+                'conflated': self._conflated,
+                'queued': len(self)}
+
+    ##########################################################################
+
+    async def _put_(self, _item):
+
+        self._received += 1
+
+        if self._policy == 'block':
+            await self._queue.put(_item)
+
+        elif self._policy == 'drop_oldest':
+
+            if self._queue.full():
+                self._queue.get_nowait()
+                self._dropped += 1
+
+            self._queue.put_nowait(_item)
+
+        else:
+            _darwin = _item[0]
+
+            # Replace in place, keeping the DARWIN's turn in the queue
+            if _darwin in self._pending:
+                self._conflated += 1
+
+            elif len(self._pending) >= self._maxsize:
+                self._pending.popitem(last=False)
+                self._dropped += 1
+
+            self._pending[_darwin] = _item
+            self._ready.set()
+
+    ##########################################################################
+
+    async def _get_(self):
+
+        if self._policy == 'conflate':
+
+            while len(self._pending) == 0:
+                self._ready.clear()
+                await self._ready.wait()
+
+            _item = self._pending.popitem(last=False)[1]
+
+        else:
+            _item = await self._queue.get()
+
+        self._delivered += 1
+
+        return _item
+
+    ##########################################################################
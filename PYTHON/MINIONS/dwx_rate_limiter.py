@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+    DWX Rate Limiter - Helper Class
+    --
+    @author: Darwinex Labs (www.darwinex.com)
+
+    Last Updated: October 18, 2026
+
+    Copyright (c) 2017-2019, Darwinex. All rights reserved.
+
+    Licensed under the BSD 3-Clause License, you may not use this file except
+    in compliance with the License.
+
+    You may obtain a copy of the License at:
+    https://opensource.org/licenses/BSD-3-Clause
+"""
+import time, asyncio, threading
+from email.utils import parsedate_to_datetime
+
+"""
+Token bucket shared by threads and coroutines alike.
+
+Every request reserves one token; the reservation is made under a lock and
+returns how long the caller must wait, so threads sleep with time.sleep()
+and coroutines with asyncio.sleep() without ever holding the lock.
+
+If _adaptive is True, the refill rate follows the server: each successful
+response raises it by _increase (up to _max_rate), each 429/503 multiplies
+it by _decrease (down to _min_rate) and any Retry-After header pauses all
+callers until the given time.
+"""
+
+class DWX_Rate_Limiter():
+
+    # Status codes that signal the server wants us to slow down
+    _throttle_codes = (429, 503)
+
+    def __init__(self,
+                 _rate=10.0,      # Initial requests / second
+                 _burst=10,       # Bucket capacity
+                 _min_rate=0.5,
+                 _max_rate=100.0,
+                 _increase=0.5,   # Additive increase per success
+                 _decrease=0.5,   # Multiplicative decrease per throttle
+                 _adaptive=True):
+
+        self._rate = float(_rate)
+        self._burst = float(_burst)
+        self._min_rate = float(_min_rate)
+        self._max_rate = float(_max_rate)
+        self._increase = _increase
+        self._decrease = _decrease
+        self._adaptive = _adaptive
+
+        self._tokens = float(_burst)
+        self._last = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    ##########################################################################
+
+    def _reserve_(self):
+
+        """Take one token and return the number of seconds to wait for it."""
+
+        with self._lock:
+
+            _now = time.monotonic()
+
+            # Refill
+            self._tokens = min(self._burst,
+                               self._tokens + (_now - self._last) * self._rate)
+            self._last = _now
+
+            # Tokens may go negative: the debt is what later callers wait on
+            self._tokens -= 1.0
+
+            _wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+            return max(_wait, self._blocked_until - _now)
+
+    def _acquire_(self):
+
+        _wait = self._reserve_()
+
+        if _wait > 0:
+            time.sleep(_wait)
+
+    async def _acquire_async_(self):
+
+        _wait = self._reserve_()
+
+        if _wait > 0:
+            await asyncio.sleep(_wait)
+
+    ##########################################################################
+
+    def _update_(self, _status, _headers=None):
+
+        """Adjust the refill rate from a response status and its headers."""
+
+        if not self._adaptive:
+            return
+
+        with self._lock:
+
+            if _status in self._throttle_codes:
+
+                self._rate = max(self._min_rate, self._rate * self._decrease)
+
+                _retry_after = self._retry_after_(_headers)
+
+                if _retry_after is not None:
+                    self._blocked_until = max(self._blocked_until,
+                                              time.monotonic() + _retry_after)
+
+                # Drop any accumulated burst
+                self._tokens = min(self._tokens, 0.0)
+
+            elif 200 <= _status < 400:
+                self._rate = min(self._max_rate, self._rate + self._increase)
+
+    ##########################################################################
+
+    def _retry_after_(self, _headers):
+
+        if not _headers or 'Retry-After' not in _headers:
+            return None
+
+        _value = _headers['Retry-After']
+
+        # Either delta-seconds or an HTTP date
+        try:
+            return max(0.0, float(_value))
+
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(_value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                return None
+
+    ##########################################################################
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+    DWX Response Cache - Helper Class
+    --
+    @author: Darwinex Labs (www.darwinex.com)
+
+    Last Updated: October 18, 2026
+
+    Copyright (c) 2017-2019, Darwinex. All rights reserved.
+
+    Licensed under the BSD 3-Clause License, you may not use this file except
+    in compliance with the License.
+
+    You may obtain a copy of the License at:
+    https://opensource.org/licenses/BSD-3-Clause
+"""
+import os, re, json, time, hashlib, threading
+from collections import OrderedDict
+
+"""
+Cache of GET response bodies used by DWX_API._Call_API_().
+
+How long a response stays fresh is set per endpoint by _ttls, a list of
+(regex, seconds) matched against the endpoint path; the first match wins and
+endpoints that match nothing are never cached (e.g. Trading / Account APIs).
+
+Entries live in an LRU dict of at most _maxsize responses and, if _cache_dir
+is given, on disk as well, so they survive notebook / kernel restarts. Once
+an entry expires it is revalidated with If-None-Match / If-Modified-Since
+when the server sent an ETag / Last-Modified, and a 304 reply renews it
+without downloading the body again.
+
+_stats_() returns hits / misses / revalidated / evictions counters.
+
+Example Usage:
+
+    _info = DWX_Info_API(_response_cache=DWX_Response_Cache(_cache_dir='DATA/HTTP'))
+
+    _info._Get_Historical_Scores_(_symbols=['THA.4.12'])   # miss
+    _info._Get_Historical_Scores_(_symbols=['THA.4.12'])   # hit
+
+    _info._response_cache._stats_()
+"""
+
+class DWX_Response_Cache():
+
+    # (endpoint regex, seconds fresh)
+    _default_ttls = [(r'^/products/[^/?]+/history/badges', 3600),
+                     (r'^/products/[^/?]+/history/quotes', 3600),
+                     (r'^/products/[^/?]+/candles', 60),
+                     (r'^/products/?(\?|$)', 600)]
+
+    def __init__(self, _ttls=None, _maxsize=1024, _cache_dir=None):
+
+        self._ttls = [(re.compile(_pattern), _seconds) for _pattern, _seconds
+                      in (_ttls if _ttls is not None else self._default_ttls)]
+
+        self._maxsize = _maxsize
+        self._cache_dir = _cache_dir
+
+        if _cache_dir is not None:
+            os.makedirs(_cache_dir, exist_ok=True)
+
+        # url -> {'body', 'expires_at', 'etag', 'last_modified'}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._revalidated = 0
+        self._evictions = 0
+
+    ##########################################################################
+
+    def _stats_(self):
+
+        with self._lock:
+            return {'hits': self._hits,
+                    'misses': self._misses,
+                    'revalidated': self._revalidated,
+                    'evictions': self._evictions,
+                    'entries': len(self._entries)}
+
+    def _clear_(self):
+
+        with self._lock:
+            self._entries.clear()
+
+        if self._cache_dir is not None:
+            for _f in os.listdir(self._cache_dir):
+                if _f.endswith('.body') or _f.endswith('.json'):
+                    os.remove(os.path.join(self._cache_dir, _f))
+
+    ##########################################################################
+
+    def _ttl_(self, _endpoint):
+
+        """Seconds a response of _endpoint stays fresh, 0 = don't cache."""
+
+        for _pattern, _seconds in self._ttls:
+            if _pattern.search(_endpoint):
+                return _seconds
+
+        return 0
+
+    ##########################################################################
+
+    def _fresh_(self, _url):
+
+        """Cached body of _url if still fresh, else None."""
+
+        _entry = self._get_(_url)
+
+        with self._lock:
+
+            if _entry is not None and time.time() < _entry['expires_at']:
+                self._hits += 1
+                return _entry['body']
+
+            self._misses += 1
+            return None
+
+    def _validators_(self, _url):
+
+        """Conditional request headers for a (stale) cached response."""
+
+        _entry = self._get_(_url)
+        _headers = {}
+
+        if _entry is not None:
+
+            if _entry.get('etag'):
+                _headers['If-None-Match'] = _entry['etag']
+
+            if _entry.get('last_modified'):
+                _headers['If-Modified-Since'] = _entry['last_modified']
+
+        return _headers
+
+    ##########################################################################
+
+    def _revalidated_(self, _url, _headers, _ttl):
+
+        """Server replied 304: renew and return the cached body."""
+
+        _entry = self._get_(_url)
+
+        if _entry is None:
+            return None
+
+        _entry = dict(_entry, expires_at=time.time() + _ttl,
+                      etag=_headers.get('ETag', _entry.get('etag')),
+                      last_modified=_headers.get('Last-Modified', _entry.get('last_modified')))
+
+        with self._lock:
+            self._revalidated += 1
+
+        self._set_(_url, _entry)
+
+        return _entry['body']
+
+    def _put_(self, _url, _body, _headers, _ttl):
+
+        if 'no-store' in _headers.get('Cache-Control', ''):
+            return
+
+        self._set_(_url, {'body': _body,
+                          'expires_at': time.time() + _ttl,
+                          'etag': _headers.get('ETag'),
+                          'last_modified': _headers.get('Last-Modified')})
+
+    ##########################################################################
+
+    def _get_(self, _url):
+
+        with self._lock:
+
+            if _url in self._entries:
+                self._entries.move_to_end(_url)
+                return self._entries[_url]
+
+        # Second tier, promoted back into memory
+        _entry = self._read_(_url)
+
+        if _entry is not None:
+            self._remember_(_url, _entry)
+
+        return _entry
+
+    def _set_(self, _url, _entry):
+
+        self._remember_(_url, _entry)
+        self._write_(_url, _entry)
+
+    def _remember_(self, _url, _entry):
+
+        with self._lock:
+
+            self._entries[_url] = _entry
+            self._entries.move_to_end(_url)
+
+            # Least recently used first
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    ##########################################################################
+
+    def _paths_(self, _url):
+
+        _name = hashlib.sha1(_url.encode('utf-8')).hexdigest()
+
+        return (os.path.join(self._cache_dir, _name + '.body'),
+                os.path.join(self._cache_dir, _name + '.json'))
+
+    def _read_(self, _url):
+
+        if self._cache_dir is None:
+            return None
+
+        _body_path, _meta_path = self._paths_(_url)
+
+        try:
+            with open(_meta_path, 'r') as _f:
+                _meta = json.load(_f)
+
+            with open(_body_path, 'rb') as _f:
+                _meta['body'] = _f.read()
+
+        except (OSError, ValueError):
+            return None
+
+        # Guard against hash collisions
+        if _meta.pop('url', None) != _url:
+            return None
+
+        return _meta
+
+    def _write_(self, _url, _entry):
+
+        if self._cache_dir is None:
+            return
+
+        _body_path, _meta_path = self._paths_(_url)
+
+        try:
+            # Body first, so metadata never points at a missing body
+            with open(_body_path + '.tmp', 'wb') as _f:
+                _f.write(_entry['body'])
+
+            os.replace(_body_path + '.tmp', _body_path)
+
+            with open(_meta_path + '.tmp', 'w') as _f:
+                json.dump({'url': _url,
+                           'expires_at': _entry['expires_at'],
+                           'etag': _entry.get('etag'),
+                           'last_modified': _entry.get('last_modified')}, _f)
+
+            os.replace(_meta_path + '.tmp', _meta_path)
+
+        except OSError as ex:
+            print('Type: {0}, Args: {1!r}'.format(type(ex).__name__, ex.args))
+
+    ##########################################################################
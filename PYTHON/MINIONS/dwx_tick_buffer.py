@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+    DWX Tick Buffer - Helper Classes
+    --
+    @author: Darwinex Labs (www.darwinex.com)
+
+    Last Updated: October 18, 2026
+
+    Copyright (c) 2017-2019, Darwinex. All rights reserved.
+
+    Licensed under the BSD 3-Clause License, you may not use this file except
+    in compliance with the License.
+
+    You may obtain a copy of the License at:
+    https://opensource.org/licenses/BSD-3-Clause
+"""
+import numpy as np
+import pandas as pd
+
+"""
+DWX_Tick_Buffer keeps the last _capacity ticks of one DARWIN in fixed NumPy
+arrays. Every tick is written twice, at i and i + _capacity, so the last N
+ticks are always one contiguous slice and _window_() can return views
+instead of copies. Appends are O(1) and memory never grows.
+
+DWX_Tick_Store holds one buffer per DARWIN plus the last quote of each,
+which replaces the forward-fill of a wide DataFrame.
+
+Example Usage:
+
+    _store = DWX_Tick_Store(_symbols=['DWZ.4.7','LVS.4.20'], _capacity=10000)
+
+    _store._append_('DWZ.4.7', 1560000000000, 101.25)
+
+    _ts, _quotes = _store._window_('DWZ.4.7', 100)   # views, no copy
+"""
+
+class DWX_Tick_Buffer():
+
+    def __init__(self, _capacity=10000):
+
+        self._capacity = _capacity
+
+        # Mirrored storage, see module docstring
+        self._ts = np.zeros(2 * _capacity, dtype=np.int64)
+        self._quotes = np.full(2 * _capacity, np.nan, dtype=np.float64)
+
+        self._head = 0      # Next write position, in [0, _capacity)
+        self._count = 0     # Number of valid ticks, <= _capacity
+
+    ##########################################################################
+
+    def __len__(self):
+        return self._count
+
+    def _append_(self, _timestamp, _quote):
+
+        _i = self._head
+
+        self._ts[_i] = self._ts[_i + self._capacity] = _timestamp
+        self._quotes[_i] = self._quotes[_i + self._capacity] = _quote
+
+        self._head = (_i + 1) % self._capacity
+
+        if self._count < self._capacity:
+            self._count += 1
+
+    ##########################################################################
+
+    def _window_(self, _n=None):
+
+        """Return read-only views of the last _n (default: all) timestamps
+        and quotes, oldest first."""
+
+        _n = self._count if _n is None else min(_n, self._count)
+
+        # Window ends at _head in the first half, or at _head + _capacity
+        # when it would otherwise wrap around
+        _end = self._head if self._head >= _n else self._head + self._capacity
+
+        _ts = self._ts[_end - _n:_end]
+        _quotes = self._quotes[_end - _n:_end]
+
+        _ts.flags.writeable = False
+        _quotes.flags.writeable = False
+
+        return _ts, _quotes
+
+    ##########################################################################
+
+class DWX_Tick_Store():
+
+    def __init__(self, _symbols=[], _capacity=10000):
+
+        self._capacity = _capacity
+        self._buffers = {}
+        self._last = {}
+
+        for _symbol in _symbols:
+            self._add_symbol_(_symbol)
+
+    ##########################################################################
+
+    def _add_symbol_(self, _symbol):
+
+        if _symbol not in self._buffers:
+            self._buffers[_symbol] = DWX_Tick_Buffer(self._capacity)
+            self._last[_symbol] = np.nan
+
+    def _append_(self, _symbol, _timestamp, _quote):
+
+        if _symbol not in self._buffers:
+            self._add_symbol_(_symbol)
+
+        self._buffers[_symbol]._append_(_timestamp, _quote)
+
+        # O(1) forward-fill carry
+        self._last[_symbol] = _quote
+
+    ##########################################################################
+
+    def _last_quotes_(self):
+
+        """Latest quote of every DARWIN (NaN until its first tick)."""
+
+        return dict(self._last)
+
+    def _window_(self, _symbol, _n=None):
+        return self._buffers[_symbol]._window_(_n)
+
+    ##########################################################################
+
+    def _to_frame_(self, _symbol, _n=None):
+
+        """Small DataFrame (copy) of the last _n ticks, for plotting."""
+
+        _ts, _quotes = self._window_(_symbol, _n)
+
+        # Copy both, pandas would otherwise index the ring buffer itself
+        return pd.DataFrame({_symbol: np.array(_quotes)}, index=np.array(_ts))
+
+    def _to_wide_frame_(self, _n=None):
+
+        """Wide, forward/back-filled DataFrame of all DARWINs, as the stream
+        used to keep in DWX_Quotes_API._df. Builds a copy, use sparingly."""
+
+        _series = []
+
+        for _symbol in self._buffers:
+
+            _ts, _quotes = self._window_(_symbol, _n)
+            _s = pd.Series(_quotes, index=_ts, name=_symbol)
+
+            # Keep the last tick per timestamp so columns can be aligned
+            _series.append(_s[~_s.index.duplicated(keep='last')])
+
+        _df = pd.concat(_series, axis=1).sort_index()
+
+        return _df.ffill().bfill()
+
+    ##########################################################################
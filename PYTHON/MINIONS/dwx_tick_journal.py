@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+"""
+    DWX Tick Journal - Helper Classes
+    --
+    @author: Darwinex Labs (www.darwinex.com)
+
+    Last Updated: October 18, 2026
+
+    Copyright (c) 2017-2019, Darwinex. All rights reserved.
+
+    Licensed under the BSD 3-Clause License, you may not use this file except
+    in compliance with the License.
+
+    You may obtain a copy of the License at:
+    https://opensource.org/licenses/BSD-3-Clause
+"""
+import os, json, time, asyncio, inspect, threading
+import numpy as np
+
+"""
+Append-only binary journal of streamed ticks, for replaying live sessions
+offline.
+
+DWX_Tick_Recorder writes fixed-width records (timestamp, symbol id, quote)
+to numbered segment files, with the symbol ids kept in symbols.json:
+
+    DATA/JOURNAL/symbols.json
+    DATA/JOURNAL/segment_000000.bin
+    DATA/JOURNAL/segment_000001.bin
+    ...
+
+DWX_Tick_Replayer memory-maps the segments and yields NumPy slices, or
+replays the ticks into the same f(darwin, quote, timestamp) handlers used by
+the Quotes and WebSocket APIs, as fast as possible or at a chosen speed.
+_replay_() takes plain functions only; _replay_async_() also awaits
+coroutine handlers, as DWX_WebSocket_API does.
+
+Example Usage:
+
+    _rec = DWX_Tick_Recorder('DATA/JOURNAL')
+
+    _quotes._process_stream_(_plot=False, _handlers=[_rec._on_tick_])
+    _ws.add_handler(_rec._on_tick_)
+    ...
+    _rec._close_()
+
+    _rep = DWX_Tick_Replayer('DATA/JOURNAL')
+
+    for _records in _rep._iter_slices_():
+        _records['ts'], _records['sid'], _records['quote']
+
+    _rep._replay_(_handlers=[_agg._on_tick_], _speed=10)
+    
+    await _rep._replay_async_(_handlers=[on_quote])
+"""
+
+_record_dtype = np.dtype([('ts', '<i8'), ('sid', '<u4'), ('quote', '<f8')])
+
+class DWX_Tick_Recorder():
+
+    def __init__(self,
+                 _journal_dir='DATA/JOURNAL',
+                 _segment_ticks=1000000,  # Records per segment file
+                 _batch=1024):            # Records buffered per write
+
+        self._journal_dir = _journal_dir
+        self._segment_ticks = _segment_ticks
+
+        os.makedirs(_journal_dir, exist_ok=True)
+
+        # Handlers may be called from the stream's ingestion thread
+        self._lock = threading.Lock()
+
+        # Continue an existing journal
+        self._symbols = _load_symbols_(_journal_dir)
+        self._ids = {_s: i for i, _s in enumerate(self._symbols)}
+
+        _segments = _list_segments_(_journal_dir)
+
+        if len(_segments) > 0:
+            self._segment = len(_segments) - 1
+            self._written = os.path.getsize(_segments[-1]) // _record_dtype.itemsize
+
+            # Drop a partially written trailing record, keeping appends aligned
+            os.truncate(_segments[-1], self._written * _record_dtype.itemsize)
+        else:
+            self._segment = 0
+            self._written = 0
+
+        self._buffer = np.empty(_batch, dtype=_record_dtype)
+        self._n = 0
+
+    ##########################################################################
+
+    def _on_tick_(self, _darwin, _quote, _timestamp):
+
+        with self._lock:
+
+            if _darwin not in self._ids:
+                self._ids[_darwin] = len(self._symbols)
+                self._symbols.append(_darwin)
+                _save_symbols_(self._journal_dir, self._symbols)
+
+            self._buffer[self._n] = (_timestamp, self._ids[_darwin], _quote)
+            self._n += 1
+
+            if self._n == len(self._buffer):
+                self._write_()
+
+    ##########################################################################
+
+    def _write_(self):
+
+        _start = 0
+
+        while _start < self._n:
+
+            if self._written == self._segment_ticks:
+                self._segment += 1
+                self._written = 0
+
+            # Fill the current segment, roll over to the next one
+            _end = min(self._n, _start + self._segment_ticks - self._written)
+
+            with open(_segment_path_(self._journal_dir, self._segment), 'ab') as _f:
+                self._buffer[_start:_end].tofile(_f)
+
+            self._written += _end - _start
+            _start = _end
+
+        self._n = 0
+
+    def _flush_(self):
+
+        with self._lock:
+            self._write_()
+
+    def _close_(self):
+        self._flush_()
+
+    ##########################################################################
+
+class DWX_Tick_Replayer():
+
+    def __init__(self, _journal_dir='DATA/JOURNAL'):
+
+        self._journal_dir = _journal_dir
+        self._symbols = _load_symbols_(_journal_dir)
+        self._segments = _list_segments_(_journal_dir)
+
+    ##########################################################################
+
+    def _load_(self, _segment):
+
+        """Memory-map one segment as a read-only structured array."""
+
+        _path = self._segments[_segment]
+
+        # Ignore a partially written trailing record
+        _count = os.path.getsize(_path) // _record_dtype.itemsize
+
+        if _count == 0:
+            return np.empty(0, dtype=_record_dtype)
+
+        return np.memmap(_path, dtype=_record_dtype, mode='r', shape=(_count,))
+
+    def _iter_slices_(self, _size=65536):
+
+        """Yield views of up to _size records, in recording order."""
+
+        for _segment in range(len(self._segments)):
+
+            _records = self._load_(_segment)
+
+            for _start in range(0, len(_records), _size):
+                yield _records[_start:_start + _size]
+
+    ##########################################################################
+
+    def _iter_ticks_(self, _speed=None):
+        
+        """Yield (darwin, quote, timestamp, seconds to wait before it)."""
+
+        _t0 = _ts0 = None
+
+        for _records in self._iter_slices_():
+
+            for _ts, _sid, _quote in zip(_records['ts'].tolist(),
+                                         _records['sid'].tolist(),
+                                         _records['quote'].tolist()):
+
+                _wait = 0
+                
+                # Keep the recorded spacing between ticks, scaled by _speed
+                if _speed is not None:
+
+                    if _t0 is None:
+                        _t0, _ts0 = time.perf_counter(), _ts
+
+                    _wait = (_ts - _ts0) / 1000 / _speed - (time.perf_counter() - _t0)
+
+                yield self._symbols[_sid], _quote, _ts, _wait
+
+    def _replay_(self,
+                 _handlers=None,  # Plain callables f(darwin, quote, timestamp)
+                 _speed=None):    # None: as fast as possible, 1: real time
+        
+        _handlers = list(_handlers or [])
+        
+        for _handler in _handlers:
+            if inspect.iscoroutinefunction(_handler):
+                raise TypeError('{} is a coroutine function, use _replay_async_()'.format(_handler))
+        
+        for _darwin, _quote, _ts, _wait in self._iter_ticks_(_speed):
+            
+            if _wait > 0:
+                time.sleep(_wait)
+            
+            for _handler in _handlers:
+                
+                _r = _handler(_darwin, _quote, _ts)
+                
+                # e.g. a partial() of a coroutine function
+                if inspect.isawaitable(_r):
+                    
+                    if inspect.iscoroutine(_r):
+                        _r.close()
+                    
+                    raise TypeError('{} returned an awaitable, use _replay_async_()'.format(_handler))
+    
+    async def _replay_async_(self,
+                             _handlers=None,  # Callables or coroutine functions f(darwin, quote, timestamp)
+                             _speed=None):    # None: as fast as possible, 1: real time
+        
+        _handlers = list(_handlers or [])
+        
+        for _darwin, _quote, _ts, _wait in self._iter_ticks_(_speed):
+            
+            if _wait > 0:
+                await asyncio.sleep(_wait)
+            
+            for _handler in _handlers:
+                
+                _r = _handler(_darwin, _quote, _ts)
+                
+                if inspect.isawaitable(_r):
+                    await _r
+
+    ##########################################################################
+
+def _segment_path_(_journal_dir, _segment):
+    return os.path.join(_journal_dir, 'segment_{:06d}.bin'.format(_segment))
+
+def _list_segments_(_journal_dir):
+
+    if not os.path.isdir(_journal_dir):
+        return []
+
+    return [os.path.join(_journal_dir, _f) for _f in sorted(os.listdir(_journal_dir))
+            if _f.startswith('segment_') and _f.endswith('.bin')]
+
+def _load_symbols_(_journal_dir):
+
+    _path = os.path.join(_journal_dir, 'symbols.json')
+
+    if not os.path.exists(_path):
+        return []
+
+    with open(_path, 'r') as _f:
+        return json.load(_f)
+
+def _save_symbols_(_journal_dir, _symbols):
+
+    # Replace atomically so a crash never leaves a truncated dictionary
+    _path = os.path.join(_journal_dir, 'symbols.json')
+
+    with open(_path + '.tmp', 'w') as _f:
+        json.dump(_symbols, _f)
+
+    os.replace(_path + '.tmp', _path)